@@ -1,36 +1,61 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Callable, Dict, Optional
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 import grpc
+import orjson
+from opentelemetry import trace
 
 from grpc_client import get_llm_plan
+from instrumentation import prompt_fingerprint
 from memory_client import get_session_history
 from tool_parser import parse_tool_call
-from instrumentation import tracer
+
+
+_SPAN_RUN_AGENT = "AgentLoop.run_agent"
+_SPAN_GET_HISTORY = "Memory.get_session_history"
+_SPAN_GET_LLM_PLAN = "ModelGateway.get_llm_plan"
+_SPAN_TOOLS_EXECUTE = "Tools.execute"
+
+# Soft cap on the assembled LLM prompt. When exceeded, the oldest
+# `<tool_response>` blocks are evicted (the history preamble and the user
+# prompt are always kept, as is the most recent tool response).
+_PROMPT_CHAR_BUDGET = int(os.environ.get("AGENT_PROMPT_CHAR_BUDGET", "32000"))
 
 
 class AgentLoop:
     def __init__(
         self,
-        tool_executor: Optional[Callable[[str, dict], dict]] = None,
+        tool_executor: Optional[Callable[[str, dict], Awaitable[dict]]] = None,
         max_turns: int = 3,
     ):
         self._tool_executor = tool_executor
         self._max_turns = max_turns
+        # Resolve the tracer once; the provider is installed before the loop is built.
+        self._tracer = trace.get_tracer("agent_loop")
 
-    async def run_agent(self, prompt: str, context: dict) -> Dict[str, Any]:
+    async def run_agent(
+        self,
+        prompt: str,
+        context: dict,
+        *,
+        history_messages: Optional[list[dict]] = None,
+    ) -> Dict[str, Any]:
         """Run the (iterative) agent loop.
 
         Structure (future): retrieve memory -> call LLM -> optionally call tools -> repeat.
         Current behavior: loop for up to `max_turns`, executing any parsed tool calls and
         augmenting the prompt with `<tool_response>` blocks between turns.
+
+        If `history_messages` is supplied (e.g. pre-fetched concurrently by the caller),
+        the internal session-history lookup is skipped.
         """
 
-        with tracer.start_as_current_span("AgentLoop.run_agent") as span:
+        tracer = self._tracer
+        with tracer.start_as_current_span(_SPAN_RUN_AGENT) as span:
             span.set_attribute("agent.max_turns", self._max_turns)
-            span.set_attribute("agent.prompt", prompt)
+            span.set_attribute("agent.prompt", prompt_fingerprint(prompt))
 
             session_id = (
                 context.get("session_id")
@@ -41,27 +66,41 @@ class AgentLoop:
 
             history: list[dict] = []
             llm_response: dict = {}
-            current_prompt: str = prompt
+            # Prompt pieces are accumulated and joined once per LLM call rather
+            # than re-concatenated every turn. Layout: [preamble, prompt, *tool_responses].
+            prompt_parts: list[str] = [prompt]
+            prompt_chars = len(prompt)
+            fixed_parts = 2  # preamble + prompt are never evicted
+            # Text added to the prompt since the previous LLM call; recorded in
+            # history instead of a full snapshot of the growing prompt.
+            prompt_delta = ""
 
             for turn in range(self._max_turns):
                 span.set_attribute("agent.turn", turn)
 
                 # 1) RETRIEVE KNOWLEDGE/MEMORY (Placeholder)
                 if turn == 0:
-                    with tracer.start_as_current_span("Memory.get_session_history") as mem_span:
-                        mem_span.set_attribute("memory.session_id", session_id)
-                        history_messages = await get_session_history(session_id)
+                    if history_messages is None:
+                        with tracer.start_as_current_span(_SPAN_GET_HISTORY) as mem_span:
+                            mem_span.set_attribute("memory.session_id", session_id)
+                            history_messages = await get_session_history(session_id)
 
-                    history_str = json.dumps(history_messages)
+                    history_str = orjson.dumps(history_messages).decode()
                     preamble = (
                         f"<history session_id='{session_id}'>\n"
                         f"{history_str}\n"
                         f"</history>\n\n"
                     )
-                    current_prompt = preamble + prompt
+                    prompt_parts.insert(0, preamble)
+                    prompt_chars += len(preamble)
+                    prompt_delta = preamble + prompt
+
+                while prompt_chars > _PROMPT_CHAR_BUDGET and len(prompt_parts) > fixed_parts + 1:
+                    prompt_chars -= len(prompt_parts.pop(fixed_parts))
+                current_prompt = "".join(prompt_parts)
 
                 # 2) CALL LLM FOR PLAN/ACTION
-                with tracer.start_as_current_span("ModelGateway.get_llm_plan"):
+                with tracer.start_as_current_span(_SPAN_GET_LLM_PLAN):
                     try:
                         llm_response = await get_llm_plan(current_prompt)
                     except grpc.aio.AioRpcError as e:
@@ -77,7 +116,7 @@ class AgentLoop:
                     {
                         "turn": turn,
                         "type": "llm_plan",
-                        "prompt": current_prompt,
+                        "prompt_delta": prompt_delta,
                         "llm_response": llm_response,
                     }
                 )
@@ -101,9 +140,9 @@ class AgentLoop:
                         )
                         break
 
-                    with tracer.start_as_current_span("Tools.execute") as tool_span:
+                    with tracer.start_as_current_span(_SPAN_TOOLS_EXECUTE) as tool_span:
                         tool_span.set_attribute("tool.name", tool_name)
-                        tool_result = self._tool_executor(tool_name, args)
+                        tool_result = await self._tool_executor(tool_name, args)
 
                     history.append(
                         {
@@ -115,12 +154,15 @@ class AgentLoop:
                         }
                     )
 
-                    tool_output_str = json.dumps(tool_result)
-                    current_prompt += (
+                    tool_output_str = orjson.dumps(tool_result).decode()
+                    tool_block = (
                         f"\n\n<tool_response tool='{tool_name}'>\n"
                         f"{tool_output_str}\n"
                         f"</tool_response>"
                     )
+                    prompt_parts.append(tool_block)
+                    prompt_chars += len(tool_block)
+                    prompt_delta = tool_block
 
                     # Continue the loop for another LLM turn with augmented context.
                     continue
@@ -1,15 +1,28 @@
+import asyncio
+import itertools
 import os
 import time
-import json
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import grpc
+import orjson
 
 
 DEFAULT_GRPC_HOST = "localhost"
 DEFAULT_GRPC_PORT = 50051
 DEFAULT_GRPC_TIMEOUT_SECONDS = 5.0
+DEFAULT_GRPC_POOL_SIZE = 2
+
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+]
+
+# Long-lived channels to the Model Gateway, shared across calls (HTTP/2 streams
+# multiplex over them). Created lazily on the running event loop.
+_channels: list[grpc.aio.Channel] = []
+_channel_cycle: Optional[itertools.cycle] = None
 
 
 def _grpc_target() -> str:
@@ -74,6 +87,49 @@ def _import_stubs():
         ) from e
 
 
+def _pool_size() -> int:
+    try:
+        return max(1, int(os.environ.get("MODEL_GATEWAY_GRPC_POOL_SIZE", DEFAULT_GRPC_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_GRPC_POOL_SIZE
+
+
+def get_channel() -> grpc.aio.Channel:
+    """Return a pooled channel to the Model Gateway (round-robin across the pool)."""
+
+    global _channel_cycle
+    if _channel_cycle is None:
+        target = _grpc_target()
+        _channels.extend(
+            grpc.aio.insecure_channel(target, options=_CHANNEL_OPTIONS)
+            for _ in range(_pool_size())
+        )
+        _channel_cycle = itertools.cycle(_channels)
+    return next(_channel_cycle)
+
+
+async def warm_channels(timeout: float = 2.0) -> None:
+    """Best-effort: connect the channel pool ahead of the first request."""
+
+    get_channel()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(channel.channel_ready() for channel in _channels)),
+            timeout=timeout,
+        )
+    except Exception:
+        # Gateway may not be up yet; the channels keep reconnecting on their own.
+        pass
+
+
+async def close_channels() -> None:
+    global _channel_cycle
+    for channel in _channels:
+        await channel.close()
+    _channels.clear()
+    _channel_cycle = None
+
+
 async def get_llm_plan(prompt: str) -> Dict[str, Any]:
     """Call the Go Model Gateway via gRPC and return a JSON-serializable payload."""
 
@@ -83,9 +139,8 @@ async def get_llm_plan(prompt: str) -> Dict[str, Any]:
     timeout = float(os.environ.get("MODEL_GATEWAY_GRPC_TIMEOUT_SECONDS", DEFAULT_GRPC_TIMEOUT_SECONDS))
     start = time.time()
 
-    async with grpc.aio.insecure_channel(target) as channel:
-        stub = model_pb2_grpc.ModelGatewayStub(channel)
-        resp = await stub.GetPlan(model_pb2.PlanRequest(prompt=prompt), timeout=timeout)
+    stub = model_pb2_grpc.ModelGatewayStub(get_channel())
+    resp = await stub.GetPlan(model_pb2.PlanRequest(prompt=prompt), timeout=timeout)
 
     elapsed_ms = int((time.time() - start) * 1000)
 
@@ -93,7 +148,7 @@ async def get_llm_plan(prompt: str) -> Dict[str, Any]:
     model_type = resp.model_name
     steps = None
     try:
-        decoded = json.loads(resp.plan)
+        decoded = orjson.loads(resp.plan)
         if isinstance(decoded, dict):
             model_type = decoded.get("model_type", model_type)
             steps = decoded.get("steps")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import os
 
 from opentelemetry import trace
@@ -9,6 +10,10 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
 
+# Span attributes are exported in full by the batch processor; prompts longer than
+# this are shortened to a prefix plus a content hash.
+_PROMPT_ATTR_MAX_CHARS = 256
+
 # Module-level tracer (becomes non-noop after setup_tracing() sets the provider).
 tracer = trace.get_tracer(__name__)
 
@@ -18,6 +23,9 @@ def setup_tracing(service_name: str):
 
     Default exporter target is OTLP/gRPC at http://localhost:4317.
     Override with OTEL_EXPORTER_OTLP_ENDPOINT.
+
+    The batch processor is tuned for bursty agent traffic (bigger queue, smaller
+    and more frequent batches); each knob honours the standard OTEL_BSP_* env vars.
     """
 
     global tracer
@@ -34,8 +42,28 @@ def setup_tracing(service_name: str):
     trace.set_tracer_provider(provider)
 
     exporter = OTLPSpanExporter(endpoint=endpoint, insecure=True)
-    provider.add_span_processor(BatchSpanProcessor(exporter))
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=int(os.environ.get("OTEL_BSP_MAX_QUEUE_SIZE", 4096)),
+            schedule_delay_millis=int(os.environ.get("OTEL_BSP_SCHEDULE_DELAY", 1000)),
+            max_export_batch_size=int(os.environ.get("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 256)),
+            export_timeout_millis=int(os.environ.get("OTEL_BSP_EXPORT_TIMEOUT", 10000)),
+        )
+    )
 
     tracer = trace.get_tracer(service_name)
     return tracer
 
+
+def prompt_fingerprint(prompt: str) -> str:
+    """Return a bounded span-attribute value for `prompt`.
+
+    Short prompts are returned unchanged; long ones become their first 256
+    characters followed by a blake2b digest of the full text.
+    """
+
+    if len(prompt) <= _PROMPT_ATTR_MAX_CHARS:
+        return prompt
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{prompt[:_PROMPT_ATTR_MAX_CHARS]}…{digest}"
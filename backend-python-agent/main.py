@@ -1,20 +1,38 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 import uvicorn
+import asyncio
 import os
+import sys
 import time
-import json
+import uuid
 import httpx
-from datetime import datetime
+import orjson
+from datetime import datetime, timezone
+from pathlib import Path
 from pydantic import BaseModel
+from typing import AsyncIterator
 
 from agent_loop import AgentLoop
+from grpc_client import close_channels, warm_channels
 from tool_executor import execute_tool
-from memory_client import store_session_history
-from instrumentation import setup_tracing
+from memory_client import (
+    close_client,
+    get_client,
+    get_session_history,
+    store_session_history,
+)
+from instrumentation import prompt_fingerprint, setup_tracing
 
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
-app = FastAPI(title="Python Agent Orchestrator")
+# Helpers shared by the Python services live in ../backend-python-common; the
+# Docker image copies them next to this file instead.
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend-python-common"))
+
+from log_writer import LogWriter  # noqa: E402
+
+app = FastAPI(title="Python Agent Orchestrator", default_response_class=ORJSONResponse)
 SERVICE_NAME = "backend-python-agent"
 VERSION = "1.0.0"
 
@@ -25,24 +43,67 @@ FastAPIInstrumentor.instrument_app(app)
 GO_BFF_URL = os.environ.get("GO_BFF_URL", "http://localhost:8002")
 REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT_SECONDS", 2))
 PORT = int(os.environ.get("PY_AGENT_PORT", 8000))
+_REQ_ID_PREFIX = "py-"
+
+# Background fire-and-forget tasks (e.g. memory persistence). asyncio only keeps
+# weak references to tasks, so hold them here until they finish.
+_inflight_tasks: set[asyncio.Task] = set()
 
 
 class PlanRequest(BaseModel):
     prompt: str = "Generate a 3-step plan to solve X."
 
 
-def execute_tool_handler(tool_name: str, args: dict) -> dict:
+async def execute_tool_handler(tool_name: str, args: dict) -> dict:
     """Thin wrapper around the Rust Sandbox tool execution call.
 
-    This is the function the future agentic loop will call.
+    This is the function the agentic loop awaits; it binds the shared HTTP client.
     """
 
-    return execute_tool(tool_name, args)
+    return await execute_tool(get_client(), tool_name, args)
 
 
 agent_loop = AgentLoop(tool_executor=execute_tool_handler, max_turns=3)
 
 
+@app.on_event("startup")
+async def _startup():
+    _log_writer.start()
+    # One pooled client for every outbound HTTP call (BFF echo + Memory).
+    app.state.http = get_client()
+    # Reuse pooled gRPC channels to the Model Gateway; connect them up front.
+    await warm_channels()
+
+
+@app.on_event("shutdown")
+async def _shutdown():
+    # Let pending best-effort writes finish before the client goes away.
+    if _inflight_tasks:
+        await asyncio.gather(*_inflight_tasks, return_exceptions=True)
+    await close_client()
+    await close_channels()
+    await _log_writer.stop()
+
+
+# Structured log lines are written in batches by a background task so request
+# handlers never block on stdout.
+_log_writer = LogWriter()
+_log = _log_writer.log
+
+
+# ISO timestamp cache for log lines: [epoch_second, formatted]. Re-formatted at
+# most once per second instead of once per request.
+_log_ts_cache: list = [0, ""]
+
+
+def _log_timestamp(epoch: float) -> str:
+    sec = int(epoch)
+    if sec != _log_ts_cache[0]:
+        _log_ts_cache[0] = sec
+        _log_ts_cache[1] = datetime.fromtimestamp(sec, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _log_ts_cache[1]
+
+
 # Middleware for structured JSON logging
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -51,7 +112,8 @@ async def log_requests(request: Request, call_next):
     process_time = time.time() - start_time
 
     log_entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _log_timestamp(start_time),
+        "ts_ms": int(start_time * 1000),
         "level": "info",
         "service": SERVICE_NAME,
         "method": request.method,
@@ -60,7 +122,7 @@ async def log_requests(request: Request, call_next):
         "latency_ms": round(process_time * 1000, 2),
         "request_id": request.headers.get("X-Request-Id", "none"),
     }
-    print(json.dumps(log_entry))
+    _log(log_entry)
     return response
 
 
@@ -69,54 +131,93 @@ def health_check():
     return {"service": SERVICE_NAME, "status": "ok", "version": VERSION}
 
 
+async def _call_bff_echo(client: httpx.AsyncClient, request_id: str) -> dict:
+    """POST to the Go BFF /echo endpoint; errors are folded into the result dict."""
+
+    try:
+        response = await client.post(
+            f"{GO_BFF_URL}/api/v1/echo",
+            json={"ping": SERVICE_NAME, "request_id": request_id},
+            headers={"X-Request-Id": request_id},
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.RequestError as e:
+        return {
+            "error": f"BFF connection error: {e.__class__.__name__}",
+            "url": f"{GO_BFF_URL}/api/v1/echo",
+        }
+    except httpx.HTTPStatusError as e:
+        return {
+            "error": f"BFF HTTP error: {e.response.status_code}",
+            "url": f"{GO_BFF_URL}/api/v1/echo",
+        }
+
+
+async def _stream_json_payload(payload: dict, stream_key: str) -> AsyncIterator[bytes]:
+    """Yield `payload` as a JSON object, encoding the `stream_key` list item by item.
+
+    All other fields are emitted first, so the first bytes go out without encoding
+    the (potentially large) list up front.
+    """
+
+    items = payload.get(stream_key) or []
+    head = orjson.dumps({k: v for k, v in payload.items() if k != stream_key})
+    key = orjson.dumps(stream_key)
+    if head == b"{}":
+        yield b"{" + key + b":["
+    else:
+        yield head[:-1] + b"," + key + b":["
+    for i, item in enumerate(items):
+        yield (b"," if i else b"") + orjson.dumps(item)
+    yield b"]}"
+
+
 @app.post("/api/v1/plan")
 async def create_agent_plan(request: Request, plan_request: PlanRequest):
     """Simulates agent planning. Calls Go BFF /echo to confirm wiring."""
 
     with tracer.start_as_current_span("AgentPlanExecution") as span:
-        request_id = request.headers.get(
-            "X-Request-Id", "generated-python-" + str(int(time.time()))
-        )
+        # Second-resolution timestamps collided under concurrency; use a random id.
+        request_id = request.headers.get("X-Request-Id") or _REQ_ID_PREFIX + uuid.uuid4().hex
         span.set_attribute("http.request_id", request_id)
-        span.set_attribute("agent.prompt", plan_request.prompt)
-
-        bff_echo_data = {}
-
-        # 1. Call Go BFF /echo to confirm reverse wiring (non-recursive check)
-        try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                headers = {"X-Request-Id": request_id}
-                response = await client.post(
-                    f"{GO_BFF_URL}/api/v1/echo",
-                    json={"ping": SERVICE_NAME, "request_id": request_id},
-                    headers=headers,
-                )
-                response.raise_for_status()
-                bff_echo_data = response.json()
-        except httpx.RequestError as e:
-            bff_echo_data = {
-                "error": f"BFF connection error: {e.__class__.__name__}",
-                "url": f"{GO_BFF_URL}/api/v1/echo",
-            }
-        except httpx.HTTPStatusError as e:
+        span.set_attribute("agent.prompt", prompt_fingerprint(plan_request.prompt))
+
+        # 1. Call Go BFF /echo to confirm reverse wiring (non-recursive check) and
+        #    fetch session memory concurrently; the two calls are independent.
+        bff_task = asyncio.create_task(_call_bff_echo(request.app.state.http, request_id))
+        hist_task = asyncio.create_task(get_session_history(request_id))
+        bff_echo_data, history_messages = await asyncio.gather(
+            bff_task, hist_task, return_exceptions=True
+        )
+        if isinstance(bff_echo_data, BaseException):
             bff_echo_data = {
-                "error": f"BFF HTTP error: {e.response.status_code}",
+                "error": f"BFF call failed: {bff_echo_data.__class__.__name__}",
                 "url": f"{GO_BFF_URL}/api/v1/echo",
             }
+        if isinstance(history_messages, BaseException):
+            history_messages = []
 
         # 2. Run the agent loop (currently 1 turn of LLM call; loop structure ready)
         agent_result = await agent_loop.run_agent(
             plan_request.prompt,
             context={"request_id": request_id, "session_id": request_id},
+            history_messages=history_messages,
         )
 
-        # 2b. Persist the full transaction back to Memory (best-effort).
-        await store_session_history(
-            session_id=request_id,
-            history=agent_result.get("history", []),
-            prompt=plan_request.prompt,
-            llm_response=agent_result.get("llm_response", {}),
+        # 2b. Persist the full transaction back to Memory (best-effort, off the
+        #     response path). Keep a strong reference until the task completes.
+        store_task = asyncio.create_task(
+            store_session_history(
+                session_id=request_id,
+                history=agent_result.get("history", []),
+                prompt=plan_request.prompt,
+                llm_response=agent_result.get("llm_response", {}),
+            )
         )
+        _inflight_tasks.add(store_task)
+        store_task.add_done_callback(_inflight_tasks.discard)
 
         response_payload = {
             "service": SERVICE_NAME,
@@ -126,10 +227,22 @@ async def create_agent_plan(request: Request, plan_request: PlanRequest):
             "request_id": request_id,
         }
 
-        # 3. Return plan payload
-        return response_payload
+        # 3. Stream the plan payload (history entries are encoded one at a time)
+        return StreamingResponse(
+            _stream_json_payload(response_payload, "history"),
+            media_type="application/json",
+        )
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=PORT, reload=False)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=PORT,
+        # uvloop has no Windows build; fall back to the stock asyncio loop there.
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=False,
+        workers=int(os.environ.get("UVICORN_WORKERS", 1)),
+    )
 
@@ -1,11 +1,75 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from datetime import datetime
+import time
 from typing import Any
 
 import httpx
+from cachetools import TTLCache
+from opentelemetry import trace
+
+
+MEMORY_URL = os.environ.get("MEMORY_URL", "http://localhost:8003").rstrip("/")
+REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT_SECONDS", 2))
+
+_LATEST_URL = f"{MEMORY_URL}/memory/latest"
+_STORE_URL = f"{MEMORY_URL}/memory/store"
+
+# Shared pooled client; created lazily (or at FastAPI startup) and reused across
+# requests so outbound calls don't pay a TCP handshake + pool setup every time.
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide `httpx.AsyncClient`, creating it on first use."""
+
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=30,
+            ),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client (called from the FastAPI shutdown hook)."""
+
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Short-lived session-history cache. Entries are dropped on a successful
+# store_session_history() for the same session, so staleness is bounded by the TTL
+# only for writes made by other processes.
+_history_cache: TTLCache = TTLCache(
+    maxsize=int(os.environ.get("MEMORY_HISTORY_CACHE_SIZE", 512)),
+    ttl=float(os.environ.get("MEMORY_HISTORY_CACHE_TTL_SECONDS", 10)),
+)
+# Concurrent misses for the same session share a single in-flight fetch.
+_history_inflight: dict[str, asyncio.Task] = {}
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+async def _fetch_session_history(session_id: str) -> list[dict[str, Any]]:
+    resp = await get_client().get(
+        _LATEST_URL,
+        params={"session_id": session_id},
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    messages = data.get("messages", []) if isinstance(data, dict) else []
+    messages = messages if isinstance(messages, list) else []
+    _history_cache[session_id] = messages
+    return messages
 
 
 async def get_session_history(session_id: str) -> list[dict[str, Any]]:
@@ -13,21 +77,30 @@ async def get_session_history(session_id: str) -> list[dict[str, Any]]:
 
     Calls: GET {MEMORY_URL}/memory/latest?session_id={session_id}
     Returns the `messages` list from the JSON response, or [] on failure.
+    Successful responses are cached in-process for a few seconds.
     """
 
-    memory_url = os.environ.get("MEMORY_URL", "http://localhost:8003")
-    timeout_seconds = float(os.environ.get("REQUEST_TIMEOUT_SECONDS", 2))
+    span = trace.get_current_span()
+    messages = _history_cache.get(session_id)
+    if messages is not None:
+        _cache_stats["hits"] += 1
+        span.set_attribute("memory.cache_hit", True)
+        span.set_attribute("memory.cache_hits", _cache_stats["hits"])
+        return messages
+
+    _cache_stats["misses"] += 1
+    span.set_attribute("memory.cache_hit", False)
+    span.set_attribute("memory.cache_misses", _cache_stats["misses"])
+
+    task = _history_inflight.get(session_id)
+    if task is None:
+        task = asyncio.create_task(_fetch_session_history(session_id))
+        _history_inflight[session_id] = task
+        task.add_done_callback(lambda _t: _history_inflight.pop(session_id, None))
 
     try:
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            resp = await client.get(
-                f"{memory_url.rstrip('/')}/memory/latest",
-                params={"session_id": session_id},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            messages = data.get("messages", []) if isinstance(data, dict) else []
-            return messages if isinstance(messages, list) else []
+        # shield(): one caller being cancelled must not cancel the shared fetch.
+        return await asyncio.shield(task)
     except Exception:
         return []
 
@@ -45,29 +118,23 @@ async def store_session_history(
     This is best-effort: returns False on any failure, True on success.
     """
 
-    memory_url = os.environ.get("MEMORY_URL", "http://localhost:8003")
-    timeout_seconds = float(os.environ.get("REQUEST_TIMEOUT_SECONDS", 2))
-
     payload: dict[str, Any] = {
         "session_id": session_id,
         "prompt": prompt,
         "history": history,
         "llm_response": llm_response,
-        "stored_at": datetime.utcnow().isoformat() + "Z",
+        "stored_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            resp = await client.post(
-                f"{memory_url.rstrip('/')}/memory/store",
-                json=payload,
-            )
-            resp.raise_for_status()
-            return True
+        resp = await get_client().post(_STORE_URL, json=payload)
+        resp.raise_for_status()
+        _history_cache.pop(session_id, None)
+        return True
     except Exception as e:
         # Log but do not raise; persistence is non-critical for the current loop.
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             "level": "warn",
             "service": "backend-python-agent",
             "component": "memory_client",
@@ -1,50 +1,69 @@
+from __future__ import annotations
+
 import os
 from typing import Any, Dict
 
-import requests
+import httpx
 
 
 def _build_url(base_url: str, path: str) -> str:
     return base_url.rstrip("/") + path
 
 
-def execute_tool(tool_name: str, args: dict) -> Dict[str, Any]:
+RUST_SANDBOX_URL = os.environ.get("RUST_SANDBOX_URL", "http://localhost:8004")
+REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT_SECONDS", "2"))
+
+_PRIMARY_URL = _build_url(RUST_SANDBOX_URL, "/execute-tool")
+_FALLBACK_URL = _build_url(RUST_SANDBOX_URL, "/api/v1/execute_tool")
+
+# Sandbox route that answered (non-404) on the first call; later calls go
+# straight to it instead of re-trying the primary route on legacy deployments.
+_resolved_url: str | None = None
+
+
+async def execute_tool(client: httpx.AsyncClient, tool_name: str, args: dict) -> Dict[str, Any]:
     """Call the Rust Sandbox tool execution endpoint.
 
     Sends a POST request to `{RUST_SANDBOX_URL}/execute-tool` with JSON body:
       {"tool_name": tool_name, "args": args}
 
+    Uses the caller's shared `httpx.AsyncClient` so the event loop is never
+    blocked on sandbox I/O and connections are reused across tool calls.
+
+    The first call resolves which route the sandbox serves (falling back to the
+    legacy `/api/v1/execute_tool` on 404); subsequent calls reuse it.
+
     Returns the sandbox JSON response payload. If the request fails, returns a
     structured error payload.
     """
 
-    rust_sandbox_url = os.environ.get("RUST_SANDBOX_URL", "http://localhost:8004")
-    timeout_seconds = float(os.environ.get("REQUEST_TIMEOUT_SECONDS", "2"))
+    global _resolved_url
 
     payload = {"tool_name": tool_name, "args": args}
-
-    primary_url = _build_url(rust_sandbox_url, "/execute-tool")
-    fallback_url = _build_url(rust_sandbox_url, "/api/v1/execute_tool")
+    url = _resolved_url or _PRIMARY_URL
 
     try:
-        resp = requests.post(primary_url, json=payload, timeout=timeout_seconds)
-        if resp.status_code == 404:
-            # Backwards-compatible fallback for older Rust Sandbox route.
-            resp = requests.post(fallback_url, json=payload, timeout=timeout_seconds)
+        resp = await client.post(url, json=payload, timeout=REQUEST_TIMEOUT)
+        if _resolved_url is None:
+            if resp.status_code == 404:
+                # Backwards-compatible fallback for older Rust Sandbox route.
+                url = _FALLBACK_URL
+                resp = await client.post(url, json=payload, timeout=REQUEST_TIMEOUT)
+            if resp.status_code != 404:
+                _resolved_url = url
 
         resp.raise_for_status()
         return resp.json()
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {
             "error": "rust_sandbox_connection_error",
             "details": str(e),
-            "url": primary_url,
+            "url": url,
         }
     except ValueError as e:
         # JSON decode error
         return {
             "error": "rust_sandbox_invalid_json",
             "details": str(e),
-            "url": primary_url,
+            "url": url,
         }
-
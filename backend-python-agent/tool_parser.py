@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-import json
 from typing import Optional
 
+import orjson
+
+
+# (envelope key, arguments key) per supported format, in priority order:
+# Format 1 (Go Agent Planner / Model Gateway), then Format 2 (Legacy).
+_FORMATS = (("tool", "args"), ("tool_call", "arguments"))
+
 
 def parse_tool_call(llm_plan_json: str) -> Optional[tuple[str, dict]]:
     """Parse a tool call from the LLM plan JSON string.
@@ -32,36 +38,33 @@ def parse_tool_call(llm_plan_json: str) -> Optional[tuple[str, dict]]:
     if not llm_plan_json:
         return None
 
-    try:
-        data = json.loads(llm_plan_json)
-    except json.JSONDecodeError:
+    # Cheap prefilter: both envelope keys ("tool" / "tool_call") start with `"tool`,
+    # so plain-text answers and unrelated JSON skip the full parse.
+    if '"tool' not in llm_plan_json:
         return None
 
-    if not isinstance(data, dict):
+    try:
+        data = orjson.loads(llm_plan_json)
+    except orjson.JSONDecodeError:
         return None
 
-    # Try Format 1: {"tool": {"name": ..., "args": ...}} (Go Agent Planner)
-    tool_obj = data.get("tool")
-    if isinstance(tool_obj, dict):
-        name = tool_obj.get("name")
-        args = tool_obj.get("args")
-        
-        if isinstance(name, str) and name.strip():
-            if args is None:
-                args = {}
-            if isinstance(args, dict):
-                return name.strip(), args
-
-    # Try Format 2: {"tool_call": {"name": ..., "arguments": ...}} (Legacy)
-    tool_call = data.get("tool_call")
-    if isinstance(tool_call, dict):
-        name = tool_call.get("name")
-        args = tool_call.get("arguments")
+    if type(data) is not dict:
+        return None
 
-        if isinstance(name, str) and name.strip():
-            if args is None:
-                args = {}
-            if isinstance(args, dict):
-                return name.strip(), args
+    for key, args_key in _FORMATS:
+        obj = data.get(key)
+        if type(obj) is not dict:
+            continue
+        name = obj.get("name")
+        if type(name) is not str:
+            continue
+        name = name.strip()
+        if not name:
+            continue
+        args = obj.get(args_key)
+        if args is None:
+            args = {}
+        if type(args) is dict:
+            return name, args
 
     return None
@@ -0,0 +1,83 @@
+"""Batched structured-log writer shared by the Python services.
+
+Log entries are queued and written to stdout as JSON lines in batches by a
+background task, so request handlers never block on stdout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import orjson
+
+
+class LogWriter:
+    def __init__(self, batch_max: int = 64, flush_interval_seconds: float = 0.05):
+        self.batch_max = batch_max
+        self.flush_interval_seconds = flush_interval_seconds
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _write(entries: list[dict]) -> None:
+        try:
+            out = sys.stdout.buffer
+            out.write(b"".join(orjson.dumps(e) + b"\n" for e in entries))
+            out.flush()
+        except Exception as e:
+            # A failed write (closed/full stream) drops this batch, not the writer.
+            try:
+                print(f"log writer: dropped {len(entries)} line(s): {e!r}", file=sys.stderr)
+            except Exception:
+                pass
+
+    def log(self, entry: dict) -> None:
+        if self._queue is None:
+            # Writer not running (e.g. before startup); write synchronously.
+            self._write([entry])
+            return
+        self._queue.put_nowait(entry)
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        # A `None` item is the stop sentinel: the batch in progress is written
+        # before the writer exits.
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await queue.get()
+            if entry is None:
+                return
+            batch = [entry]
+            deadline = loop.time() + self.flush_interval_seconds
+            while len(batch) < self.batch_max:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            self._write(batch)
+
+    def start(self) -> None:
+        """Start the writer on the current asyncio event loop."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._drain(self._queue))
+
+    async def stop(self) -> None:
+        """Stop the writer once every entry logged so far is written."""
+        if self._task is None:
+            return
+        queue, task = self._queue, self._task
+        # Later entries are written synchronously.
+        self._queue = None
+        self._task = None
+        queue.put_nowait(None)
+        await task
@@ -0,0 +1,38 @@
+"""Generate the Python gRPC stubs for the memory service into ./proto.
+
+Run at build time (the Dockerfile does this) or once after editing model.proto:
+
+	python build_protos.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from grpc_tools import protoc
+
+_PROTO_DIR = Path(__file__).resolve().parent / "proto"
+
+
+def build_protos() -> None:
+	proto_file = _PROTO_DIR / "model.proto"
+	result = protoc.main(
+		[
+			"grpc_tools.protoc",
+			f"-I{_PROTO_DIR}",
+			f"--python_out={_PROTO_DIR}",
+			f"--grpc_python_out={_PROTO_DIR}",
+			str(proto_file),
+		]
+	)
+	if result != 0:
+		raise RuntimeError(f"protoc failed with exit code {result}")
+
+
+if __name__ == "__main__":
+	try:
+		build_protos()
+	except RuntimeError as e:
+		print(str(e), file=sys.stderr)
+		sys.exit(1)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 import os
-from datetime import datetime
+import sys
+import time
+from pathlib import Path
 from typing import Any
 
 import uvicorn
@@ -16,11 +17,17 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-from memory_service import (
+# Helpers shared by the Python services live in ../backend-python-common; the
+# Docker image copies them next to this file instead.
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend-python-common"))
+
+from log_writer import LogWriter  # noqa: E402
+from memory_service import (  # noqa: E402
     check_health,
+    enqueue_mind_playbook,
     get_mock_session_history,
     start_grpc_server_background,
-    store_mind_playbook,
+    stop_playbook_writer,
 )
 
 
@@ -34,7 +41,13 @@ def setup_tracing(service_name: str):
     provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
     trace.set_tracer_provider(provider)
     provider.add_span_processor(
-        BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint, insecure=True))
+        BatchSpanProcessor(
+            OTLPSpanExporter(endpoint=endpoint, insecure=True),
+            max_queue_size=int(os.environ.get("OTEL_BSP_MAX_QUEUE_SIZE", 4096)),
+            schedule_delay_millis=int(os.environ.get("OTEL_BSP_SCHEDULE_DELAY", 1000)),
+            max_export_batch_size=int(os.environ.get("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 256)),
+            export_timeout_millis=int(os.environ.get("OTEL_BSP_EXPORT_TIMEOUT", 10000)),
+        )
     )
 
 
@@ -42,11 +55,25 @@ setup_tracing(SERVICE_NAME)
 FastAPIInstrumentor.instrument_app(app)
 
 
+# Structured log lines are written in batches by a background task so request
+# handlers never block on stdout.
+_log_writer = LogWriter()
+_log = _log_writer.log
+
+
 @app.on_event("startup")
 async def _startup():
+    _log_writer.start()
     grpc_port = int(os.environ.get("MEMORY_GRPC_PORT", "50052"))
     start_grpc_server_background(port=grpc_port)
 
+
+@app.on_event("shutdown")
+async def _shutdown():
+    await stop_playbook_writer()
+    await _log_writer.stop()
+
+
 PORT = int(os.environ.get("MEMORY_PORT", 8003))
 
 
@@ -79,7 +106,7 @@ def get_latest_memory(session_id: str):
 
 
 @app.post("/memory/store")
-def store_memory(payload: StoreHistoryPayload):
+async def store_memory(payload: StoreHistoryPayload):
     """Accept and "store" session history.
 
     Persistence is simulated for now by printing a structured summary.
@@ -87,7 +114,7 @@ def store_memory(payload: StoreHistoryPayload):
 
     turns = len(payload.history) if isinstance(payload.history, list) else 0
     log_entry = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "level": "info",
         "service": SERVICE_NAME,
         "method": "POST /memory/store",
@@ -95,21 +122,25 @@ def store_memory(payload: StoreHistoryPayload):
         "turns": turns,
         "message": "received session history for persistence (simulated)",
     }
-    print(json.dumps(log_entry))
-
+    _log(log_entry)
 
     return {"status": "ok", "session_id": payload.session_id, "turns": turns}
 
 
 @app.post("/memory/playbook")
-def store_playbook(payload: StorePlaybookPayload):
+async def store_playbook(payload: StorePlaybookPayload):
     """Persist a successful multi-step tool sequence into Mind-KB.
 
     This is called by the Go Agent Planner when it detects successful completion
     after one or more tool calls.
+
+    The playbook is queued for a background batch writer, so "ok" is returned
+    before the write lands: the ID is derived from the content and is final,
+    but a failed embedding/upsert is only logged (to stderr), not reported to
+    the caller.
     """
 
-    playbook_id = store_mind_playbook(
+    playbook_id = await enqueue_mind_playbook(
         session_id=payload.session_id,
         prompt=payload.prompt,
         history_sequence=payload.history_sequence,
@@ -118,5 +149,14 @@ def store_playbook(payload: StorePlaybookPayload):
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=PORT, reload=False)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=PORT,
+        # uvloop has no Windows build; fall back to the stock asyncio loop there.
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=False,
+        workers=int(os.environ.get("UVICORN_WORKERS", 1)),
+    )
 
@@ -6,10 +6,14 @@ import json
 import os
 import sqlite3
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import chromadb
+import numpy as np
 
 from sentence_transformers import SentenceTransformer
 
@@ -50,12 +54,14 @@ class HashEmbeddingFunction:
 		return cls(dim=dim)
 
 	def __call__(self, input: list[str]) -> list[list[float]]:
-		vectors: list[list[float]] = []
-		for text in input:
-			digest = hashlib.sha256(text.encode("utf-8")).digest()
-			vec = [digest[i % len(digest)] / 255.0 for i in range(self.dim)]
-			vectors.append(vec)
-		return vectors
+		width = hashlib.sha256().digest_size
+		digests = np.frombuffer(
+			b"".join(hashlib.sha256(text.encode("utf-8")).digest() for text in input), dtype=np.uint8
+		).reshape(-1, width)
+		if self.dim > width:
+			# Repeat the digest cyclically, i.e. digest[i % len(digest)].
+			digests = np.tile(digests, (1, -(-self.dim // width)))
+		return (digests[:, : self.dim] / 255.0).tolist()
 
 
 class SentenceTransformerEmbeddingFunction:
@@ -64,9 +70,20 @@ class SentenceTransformerEmbeddingFunction:
 	This provides meaningful vector search for ChromaDB-backed RAG.
 	"""
 
+	# Max number of text -> vector entries kept by the in-process LRU cache.
+	CACHE_CAPACITY = 10_000
+
+	# encode() batch size per device; GPUs stay efficient at much larger batches.
+	BATCH_SIZES = {"cuda": 256, "cpu": 64}
+
 	def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
 		self.model_name = model_name
-		self._model = SentenceTransformer(model_name)
+		self.device = self._select_device()
+		self._batch_size = self.BATCH_SIZES.get(self.device, self.BATCH_SIZES["cpu"])
+		self._model = SentenceTransformer(model_name, device=self.device)
+		self._optimize_model()
+		self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+		self._cache_lock = threading.Lock()
 
 	# Chroma embedding-function protocol metadata
 	def name(self) -> str:
@@ -82,11 +99,92 @@ class SentenceTransformerEmbeddingFunction:
 			model_name = str(config.get("model_name") or model_name)
 		return cls(model_name=model_name)
 
+	@staticmethod
+	def _select_device() -> str:
+		"""Use CUDA when available unless EMBEDDING_DEVICE pins a device explicitly."""
+		device = os.environ.get("EMBEDDING_DEVICE")
+		if device:
+			return device
+		import torch
+
+		return "cuda" if torch.cuda.is_available() else "cpu"
+
+	def _optimize_model(self) -> None:
+		"""Reduce inference cost: INT8 dynamic quantization on CPU, FP16 on GPU.
+
+		Controlled by EMBEDDING_QUANTIZE (default on) and EMBEDDING_MAX_SEQ_LENGTH
+		(default 128 tokens). Failures leave the FP32 model untouched.
+		"""
+		max_seq = int(os.environ.get("EMBEDDING_MAX_SEQ_LENGTH", "128"))
+		if max_seq > 0:
+			self._model.max_seq_length = max_seq
+
+		if os.environ.get("EMBEDDING_QUANTIZE", "1").lower() in {"0", "false", "no", "off"}:
+			return
+
+		try:
+			import torch
+
+			if self._model.device.type == "cpu":
+				transformer = self._model[0]
+				transformer.auto_model = torch.ao.quantization.quantize_dynamic(
+					transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+				)
+			else:
+				self._model.half()
+		except Exception as e:
+			print(
+				json.dumps(
+					{
+						"level": "warn",
+						"service": "backend-python-memory",
+						"message": "embedding_model_quantization_failed; using fp32",
+						"error": str(e),
+					}
+				)
+			)
+
+	@staticmethod
+	def _cache_key(text: str) -> str:
+		return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
 	def __call__(self, input: list[str]) -> list[list[float]]:
-		# SentenceTransformer.encode returns numpy arrays by default; tolist() converts
-		# to standard Python floats for compatibility with Chroma.
-		embeddings = self._model.encode(input, convert_to_numpy=True)
-		return embeddings.tolist()
+		# Repeated texts (seed docs, repeated RAG queries, identical playbooks) are
+		# served from the LRU cache; only misses go through the model.
+		keys = [self._cache_key(text) for text in input]
+		vectors: list[np.ndarray | None] = [None] * len(input)
+		miss_idx: list[int] = []
+		with self._cache_lock:
+			for i, key in enumerate(keys):
+				vec = self._cache.get(key)
+				if vec is None:
+					miss_idx.append(i)
+				else:
+					self._cache.move_to_end(key)
+					vectors[i] = vec
+
+		if miss_idx:
+			# SentenceTransformer.encode returns numpy arrays by default.
+			encoded = self._model.encode(
+				[input[i] for i in miss_idx],
+				convert_to_numpy=True,
+				batch_size=self._batch_size,
+				normalize_embeddings=True,
+				show_progress_bar=False,
+			)
+			# Rows are already L2-normalized by encode(); pin them to contiguous float32
+			# (FP16 models on GPU would otherwise hand back float16) so cached and
+			# stored vectors are normalized exactly once and share one dtype.
+			encoded = np.ascontiguousarray(encoded, dtype=np.float32)
+			with self._cache_lock:
+				for i, vec in zip(miss_idx, encoded):
+					vectors[i] = vec
+					self._cache[keys[i]] = vec
+				while len(self._cache) > self.CACHE_CAPACITY:
+					self._cache.popitem(last=False)
+
+		# tolist() converts to standard Python floats for compatibility with Chroma.
+		return [vec.tolist() for vec in vectors]
 
 
 _chroma_client: chromadb.ClientAPI | None = None
@@ -122,7 +220,43 @@ def _build_embedding_fn():
 		return HashEmbeddingFunction(dim=int(os.environ.get("EMBEDDING_HASH_DIM", "32")))
 
 
-_embedding_fn = _build_embedding_fn()
+class _LazyEmbedder:
+	"""Proxy that builds the real embedding function on first use.
+
+	Importing the module stays cheap; the SentenceTransformer weights are only
+	loaded once a collection is opened or something is embedded. name() and
+	get_config() report the function that was actually built, so a fallback to
+	hash embeddings is never recorded under the sentence-transformers identity.
+	"""
+
+	def __init__(self):
+		self._fn = None
+		self._lock = threading.Lock()
+
+	def _get(self):
+		fn = self._fn
+		if fn is None:
+			with self._lock:
+				fn = self._fn
+				if fn is None:
+					fn = self._fn = _build_embedding_fn()
+		return fn
+
+	def name(self) -> str:
+		return self._get().name()
+
+	def get_config(self) -> dict[str, Any]:
+		return self._get().get_config()
+
+	@classmethod
+	def build_from_config(cls, config: dict[str, Any]) -> "_LazyEmbedder":
+		return cls()
+
+	def __call__(self, input: list[str]) -> list[list[float]]:
+		return self._get()(input)
+
+
+_embedding_fn = _LazyEmbedder()
 
 
 def get_chroma_client() -> chromadb.ClientAPI:
@@ -141,10 +275,50 @@ def get_chroma_client() -> chromadb.ClientAPI:
 	return _chroma_client
 
 
+_async_chroma_client: Any = None
+
+
+async def get_async_chroma_client():
+	"""Return a cached chromadb.AsyncHttpClient, or None when Chroma is embedded."""
+	global _async_chroma_client
+	if _async_chroma_client is None:
+		host = os.environ.get("CHROMA_HOST")
+		if not host:
+			return None
+		port = os.environ.get("CHROMA_PORT")
+		port_i = int(port) if port and port.isdigit() else 8000
+		_async_chroma_client = await chromadb.AsyncHttpClient(host=host, port=port_i)
+	return _async_chroma_client
+
+
+# Collection handles are reused across requests so get_or_create_collection (an
+# HTTP round-trip in server mode) runs once per KB. Entries are dropped when an
+# operation on the handle fails, forcing a fresh lookup on the next call.
+_collection_cache: dict[str, Any] = {}
+_async_collection_cache: dict[str, Any] = {}
+
+
 def get_collection(name: str):
 	# Keep one collection per conceptual KB.
-	client = get_chroma_client()
-	return client.get_or_create_collection(name=name, embedding_function=_embedding_fn)
+	collection = _collection_cache.get(name)
+	if collection is None:
+		client = get_chroma_client()
+		collection = client.get_or_create_collection(name=name, embedding_function=_embedding_fn)
+		_collection_cache[name] = collection
+	return collection
+
+
+async def get_async_collection(client: Any, name: str):
+	collection = _async_collection_cache.get(name)
+	if collection is None:
+		collection = await client.get_or_create_collection(name=name, embedding_function=_embedding_fn)
+		_async_collection_cache[name] = collection
+	return collection
+
+
+def invalidate_collection(name: str) -> None:
+	_collection_cache.pop(name, None)
+	_async_collection_cache.pop(name, None)
 
 
 def check_health() -> tuple[bool, str]:
@@ -177,22 +351,66 @@ def check_health() -> tuple[bool, str]:
 	return True, "ok"
 
 
+def _is_seeded(kb: str) -> bool:
+	"""Return whether the KB collection exists and holds at least one record.
+
+	The collection is opened without an embedding function (count() does not
+	need one) so the probe never loads the embedding model.
+	"""
+	try:
+		collection = get_chroma_client().get_collection(name=kb, embedding_function=None)
+		return collection.count() > 0
+	except Exception:
+		# Missing (or unreadable) collections go through the normal seeding path.
+		return False
+
+
 def seed_rag_collections() -> None:
-	"""Ensure each RAG KB has at least one record so retrieval works immediately."""
-	for kb in RAG_KNOWLEDGE_BASES:
+	"""Ensure each RAG KB has at least one record so retrieval works immediately.
+
+	When every KB is already seeded the embedding model is never loaded here.
+	"""
+	pending = [kb for kb in RAG_KNOWLEDGE_BASES if not _is_seeded(kb)]
+	if not pending:
+		return
+
+	# One batched encode for every KB that needs seeding.
+	texts = [f"Seed document for {kb}. This is initial mock knowledge." for kb in pending]
+	vectors = _embedding_fn(texts)
+	for kb, text, vec in zip(pending, texts, vectors):
 		collection = get_collection(kb)
-		if collection.count() == 0:
-			collection.add(
-				ids=[f"seed-{kb}"],
-				documents=[f"Seed document for {kb}. This is initial mock knowledge."],
-				metadatas=[{"knowledge_base": kb, "kind": "seed"}],
-			)
+		collection.add(
+			ids=[f"seed-{kb}"],
+			documents=[text],
+			embeddings=[vec],
+			metadatas=[{"knowledge_base": kb, "kind": "seed"}],
+		)
 
 
 # Seed collections at import time so the service is usable immediately.
 seed_rag_collections()
 
 
+def _format_matches(kb: str, res: dict[str, Any]) -> list[dict[str, Any]]:
+	ids = (res.get("ids") or [[]])[0]
+	docs = (res.get("documents") or [[]])[0]
+	dists = (res.get("distances") or [[]])[0]
+
+	return [
+		{
+			"id": ids[i],
+			"text": docs[i],
+			"distance": dists[i],
+			"knowledge_base": kb,
+			"source": "chroma",
+		}
+		for i in range(min(len(ids), len(docs), len(dists)))
+	]
+
+
+_rag_query_pool = ThreadPoolExecutor(max_workers=len(RAG_KNOWLEDGE_BASES) + 1, thread_name_prefix="rag-query")
+
+
 def rag_retrieve(query: str, knowledge_bases: list[str] | None = None, top_k: int = 1) -> list[dict[str, Any]]:
 	"""Query Chroma across multiple conceptual KB collections.
 
@@ -205,32 +423,113 @@ def rag_retrieve(query: str, knowledge_bases: list[str] | None = None, top_k: in
 	if len(kb_list) == 0:
 		kb_list = ["Body-KB"]
 
-	matches: list[dict[str, Any]] = []
-	for kb in kb_list:
+	# Encode the query once and reuse the vector for every KB instead of letting
+	# each collection.query() re-embed the same text.
+	qvec = _embedding_fn([query])[0]
+
+	def _query_kb(kb: str) -> list[dict[str, Any]]:
 		collection = get_collection(kb)
-		res = collection.query(query_texts=[query], n_results=top_k)
+		try:
+			res = collection.query(query_embeddings=[qvec], n_results=top_k)
+		except Exception:
+			invalidate_collection(kb)
+			raise
+		return _format_matches(kb, res)
 
-		ids = (res.get("ids") or [[]])[0]
-		docs = (res.get("documents") or [[]])[0]
-		dists = (res.get("distances") or [[]])[0]
+	if len(kb_list) == 1:
+		return _query_kb(kb_list[0])
 
-		for i in range(min(len(ids), len(docs), len(dists))):
-			matches.append(
-				{
-					"id": ids[i],
-					"text": docs[i],
-					"distance": dists[i],
-					"knowledge_base": kb,
-					"source": "chroma",
-				}
-			)
+	# Per-KB searches are independent (HTTP round-trips or GIL-releasing HNSW
+	# lookups), so run them concurrently; results keep kb_list order.
+	matches: list[dict[str, Any]] = []
+	for kb_matches in _rag_query_pool.map(_query_kb, kb_list):
+		matches.extend(kb_matches)
+	return matches
+
+
+async def rag_retrieve_async(
+	query: str, knowledge_bases: list[str] | None = None, top_k: int = 1
+) -> list[dict[str, Any]]:
+	"""Async variant of rag_retrieve() for the gRPC servicer.
+
+	With a remote Chroma (CHROMA_HOST) the per-KB queries go through
+	chromadb.AsyncHttpClient concurrently on the event loop. The embedded
+	PersistentClient has no async API, so that mode runs rag_retrieve() in a
+	worker thread instead; either way the event loop is never blocked.
+	"""
+	client = await get_async_chroma_client()
+	if client is None:
+		return await asyncio.to_thread(rag_retrieve, query, knowledge_bases, top_k)
+
+	if top_k <= 0:
+		top_k = 1
+	kb_list = knowledge_bases or ["Body-KB"]
+
+	# Embedding is CPU-bound; keep it off the loop.
+	qvec = (await asyncio.to_thread(_embedding_fn, [query]))[0]
 
+	async def _query_kb(kb: str) -> list[dict[str, Any]]:
+		collection = await get_async_collection(client, kb)
+		try:
+			res = await collection.query(query_embeddings=[qvec], n_results=top_k)
+		except Exception:
+			invalidate_collection(kb)
+			raise
+		return _format_matches(kb, res)
+
+	matches: list[dict[str, Any]] = []
+	for kb_matches in await asyncio.gather(*(_query_kb(kb) for kb in kb_list)):
+		matches.extend(kb_matches)
 	return matches
 
 
 # --- Mind-KB: evolving playbooks (successful multi-step tool sequences) ---
 
 
+def _build_playbook(
+	session_id: str, prompt: str, history_sequence: list[dict[str, str]]
+) -> tuple[str, str, dict[str, str]]:
+	"""Return `(playbook_id, playbook_text, metadata)` for one playbook."""
+	# Summarize the sequence into a dense text format for vector search.
+	playbook_text = summarize_history_for_mind_kb(prompt, history_sequence)
+
+	# Stable ID for dedupe (not a security boundary, so a fast hash suffices).
+	playbook_id = hashlib.blake2b(playbook_text.encode("utf-8"), digest_size=16).hexdigest()
+
+	metadata = {
+		"source_session": session_id,
+		"original_prompt": prompt,
+		"kind": "playbook",
+	}
+	return playbook_id, playbook_text, metadata
+
+
+def _write_playbooks(playbooks: list[tuple[str, str, dict[str, str]]]) -> None:
+	"""Embed and store a batch of playbooks in Mind-KB with one Chroma write."""
+	# Chroma rejects duplicate ids within one call; keep the latest per id.
+	by_id = {playbook_id: (text, meta) for playbook_id, text, meta in playbooks}
+	ids = list(by_id)
+	documents = [text for text, _meta in by_id.values()]
+	metadatas = [meta for _text, meta in by_id.values()]
+	embeddings = _embedding_fn(documents)
+
+	mind_kb_collection = get_collection(MIND_KB_NAME)
+	# Prefer upsert if available (avoids duplicate-id errors).
+	if hasattr(mind_kb_collection, "upsert"):
+		try:
+			mind_kb_collection.upsert(ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings)
+		except Exception:
+			invalidate_collection(MIND_KB_NAME)
+			raise
+	else:
+		# Fallback for older Chroma clients.
+		try:
+			mind_kb_collection.add(ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings)
+		except Exception:
+			# If the ID already exists, treat it as a no-op.
+			pass
+
+
 def store_mind_playbook(session_id: str, prompt: str, history_sequence: list[dict[str, str]]):
 	"""Stores a successful task sequence (Playbook) into the Mind-KB for future RAG retrieval.
 
@@ -241,48 +540,99 @@ def store_mind_playbook(session_id: str, prompt: str, history_sequence: list[dic
 	- the original user prompt
 	- tool-plans and tool-results
 	- the final successful assistant completion
+
+	Writes synchronously; request handlers should prefer `enqueue_mind_playbook`.
 	"""
-	mind_kb_collection = get_collection(MIND_KB_NAME)
+	playbook = _build_playbook(session_id, prompt, history_sequence)
+	_write_playbooks([playbook])
+	return playbook[0]
 
-	# 1) Summarize the sequence into a dense text format for vector search.
-	playbook_text = summarize_history_for_mind_kb(prompt, history_sequence)
 
-	# 2) Stable ID for dedupe.
-	playbook_id = hashlib.sha256(playbook_text.encode("utf-8")).hexdigest()
+# Playbooks from concurrent requests are coalesced and written in batches (one
+# embedding call + one upsert per batch) by a background task.
+_PLAYBOOK_BATCH_MAX = 32
+_PLAYBOOK_FLUSH_INTERVAL_SECONDS = 0.5
+_playbook_queue: asyncio.Queue | None = None
+_playbook_task: asyncio.Task | None = None
 
-	# 3) Store in Chroma DB.
-	# Prefer upsert if available (avoids duplicate-id errors).
-	if hasattr(mind_kb_collection, "upsert"):
-		mind_kb_collection.upsert(
-			ids=[playbook_id],
-			documents=[playbook_text],
-			metadatas=[
+
+async def _flush_playbooks(batch: list[tuple[str, str, dict[str, str]]]) -> None:
+	try:
+		await asyncio.to_thread(_write_playbooks, batch)
+	except Exception as e:
+		print(
+			json.dumps(
 				{
-					"source_session": session_id,
-					"original_prompt": prompt,
-					"kind": "playbook",
+					"level": "error",
+					"service": "backend-python-memory",
+					"message": "mind_kb_playbook_batch_write_failed",
+					"playbooks": len(batch),
+					"error": str(e),
 				}
-			],
+			),
+			file=sys.stderr,
 		)
-	else:
-		# Fallback for older Chroma clients.
-		try:
-			mind_kb_collection.add(
-				ids=[playbook_id],
-				documents=[playbook_text],
-				metadatas=[
-					{
-						"source_session": session_id,
-						"original_prompt": prompt,
-						"kind": "playbook",
-					}
-				],
-			)
-		except Exception:
-			# If the ID already exists, treat it as a no-op.
-			pass
 
-	return playbook_id
+
+async def _drain_playbooks(queue: asyncio.Queue) -> None:
+	# A `None` item is the stop sentinel: the batch in progress is written
+	# before the writer exits.
+	loop = asyncio.get_running_loop()
+	stopping = False
+	while not stopping:
+		playbook = await queue.get()
+		if playbook is None:
+			return
+		batch = [playbook]
+		deadline = loop.time() + _PLAYBOOK_FLUSH_INTERVAL_SECONDS
+		while len(batch) < _PLAYBOOK_BATCH_MAX:
+			remaining = deadline - loop.time()
+			if remaining <= 0:
+				break
+			try:
+				playbook = await asyncio.wait_for(queue.get(), remaining)
+			except asyncio.TimeoutError:
+				break
+			if playbook is None:
+				stopping = True
+				break
+			batch.append(playbook)
+		await _flush_playbooks(batch)
+
+
+def start_playbook_writer() -> None:
+	"""Start the Mind-KB batch writer on the current asyncio event loop."""
+	global _playbook_queue, _playbook_task
+	if _playbook_task is not None:
+		return
+	_playbook_queue = asyncio.Queue()
+	_playbook_task = asyncio.get_running_loop().create_task(_drain_playbooks(_playbook_queue))
+
+
+async def stop_playbook_writer() -> None:
+	"""Stop the batch writer once every playbook queued so far is written."""
+	global _playbook_queue, _playbook_task
+	if _playbook_task is None:
+		return
+	queue, task = _playbook_queue, _playbook_task
+	# Later enqueues fall back to synchronous writes.
+	_playbook_queue = None
+	_playbook_task = None
+	queue.put_nowait(None)
+	await task
+
+
+async def enqueue_mind_playbook(session_id: str, prompt: str, history_sequence: list[dict[str, str]]) -> str:
+	"""Queue a playbook for the batch writer and return its ID immediately.
+
+	Falls back to a synchronous write (off the event loop) when the writer is not running.
+	"""
+	playbook = _build_playbook(session_id, prompt, history_sequence)
+	if _playbook_queue is None:
+		await asyncio.to_thread(_write_playbooks, [playbook])
+	else:
+		_playbook_queue.put_nowait(playbook)
+	return playbook[0]
 
 
 def summarize_history_for_mind_kb(prompt: str, history_sequence: list[dict[str, str]]) -> str:
@@ -325,39 +675,21 @@ def summarize_history_for_mind_kb(prompt: str, history_sequence: list[dict[str,
 
 _PROTO_DIR = Path(__file__).resolve().parent / "proto"
 
-
-def _ensure_proto_generated() -> None:
-	"""Generate Python gRPC stubs into ./proto if they don't exist yet."""
-	if (_PROTO_DIR / "model_pb2.py").exists() and (_PROTO_DIR / "model_pb2_grpc.py").exists():
-		return
-
-	# Generate stubs from the local copy of model.proto.
-	from grpc_tools import protoc
-
-	proto_file = _PROTO_DIR / "model.proto"
-	result = protoc.main(
-		[
-			"grpc_tools.protoc",
-			f"-I{_PROTO_DIR}",
-			f"--python_out={_PROTO_DIR}",
-			f"--grpc_python_out={_PROTO_DIR}",
-			str(proto_file),
-		]
-	)
-	if result != 0:
-		raise RuntimeError(f"protoc failed with exit code {result}")
-
-
-_ensure_proto_generated()
-
 # Import proto modules - ensure proto directory is on sys.path for generated imports
 # The generated model_pb2_grpc.py uses `import model_pb2`, so proto dir must be on sys.path
 if str(_PROTO_DIR) not in sys.path:
 	sys.path.insert(0, str(_PROTO_DIR))
 
 import grpc  # noqa: E402
-import model_pb2  # type: ignore[import-untyped]  # noqa: E402
-import model_pb2_grpc  # type: ignore[import-untyped]  # noqa: E402
+
+# Stubs are generated at build time (see build_protos.py), not on import.
+try:  # noqa: E402
+	import model_pb2  # type: ignore[import-untyped]
+	import model_pb2_grpc  # type: ignore[import-untyped]
+except ImportError as e:  # noqa: E402
+	raise RuntimeError(
+		f"gRPC stubs not found in {_PROTO_DIR}; generate them with `python build_protos.py`"
+	) from e
 
 # Optional dependency: grpcio-health-checking.
 #
@@ -370,23 +702,32 @@ except Exception:  # noqa: E402
 	health_pb2_grpc = None
 
 
-class _GRPCMetadataGetter(Getter[list[tuple[str, str]]]):
-	def get(self, carrier: list[tuple[str, str]], key: str) -> list[str] | None:
+def _metadata_carrier(metadata) -> dict[str, list[str]]:
+	"""Index gRPC invocation metadata by lower-cased key in a single pass."""
+	carrier: dict[str, list[str]] = {}
+	for k, v in metadata:
+		carrier.setdefault(k.lower(), []).append(v)
+	return carrier
+
+
+class _GRPCMetadataGetter(Getter[dict[str, list[str]]]):
+	def get(self, carrier: dict[str, list[str]], key: str) -> list[str] | None:
 		if not key:
 			return None
-		key = key.lower()
-		vals = [v for (k, v) in carrier if k.lower() == key]
-		return vals or None
+		return carrier.get(key.lower()) or None
+
+	def keys(self, carrier: dict[str, list[str]]) -> list[str]:
+		return list(carrier.keys())
 
-	def keys(self, carrier: list[tuple[str, str]]) -> list[str]:
-		return [k for (k, _v) in carrier]
+
+_metadata_getter = _GRPCMetadataGetter()
 
 
 class ModelGatewayServicer(model_pb2_grpc.ModelGatewayServicer):
 	async def GetRAGContext(self, request, context):
 		# Extract OpenTelemetry trace context from incoming gRPC metadata.
-		md = list(context.invocation_metadata())
-		ctx = extract(_GRPCMetadataGetter(), md)
+		md = _metadata_carrier(context.invocation_metadata() or ())
+		ctx = extract(_metadata_getter, md)
 		token = attach(ctx)
 		try:
 			tracer = trace.get_tracer(__name__)
@@ -395,7 +736,7 @@ class ModelGatewayServicer(model_pb2_grpc.ModelGatewayServicer):
 				top_k = int(request.top_k) if request.top_k else 1
 				kb_list = list(request.knowledge_bases)
 
-				matches = rag_retrieve(query=query, knowledge_bases=kb_list, top_k=top_k)
+				matches = await rag_retrieve_async(query=query, knowledge_bases=kb_list, top_k=top_k)
 				pb_matches = [
 					model_pb2.RAGMatch(
 						id=m.get("id", ""),
@@ -452,9 +793,10 @@ async def _serve_grpc(port: int) -> None:
 
 
 def start_grpc_server_background(port: int = 50052) -> None:
-	"""Start the gRPC server on the current asyncio event loop."""
+	"""Start the gRPC server (and the Mind-KB batch writer) on the current asyncio event loop."""
 	loop = asyncio.get_running_loop()
 	loop.create_task(_serve_grpc(port))
+	start_playbook_writer()
 
 
 def get_mock_session_history(session_id: str) -> list[dict]:
@@ -465,6 +807,16 @@ def get_mock_session_history(session_id: str) -> list[dict]:
 
 _SESSION_DB_PATH = "./session_history.db"
 
+# Optional dependency: orjson (faster (de)serialization of history_json).
+try:
+	import orjson
+
+	_json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+	_json_loads = json.loads
+
+_EMPTY_HISTORY_JSON = "[]"
+
 
 def _init_session_schema(conn: sqlite3.Connection) -> None:
 	conn.execute(
@@ -478,10 +830,36 @@ def _init_session_schema(conn: sqlite3.Connection) -> None:
 	conn.commit()
 
 
+# One long-lived connection per thread (sqlite3 connections are not shareable
+# across threads by default); the schema is created once per process.
+_session_db_local = threading.local()
+_session_schema_lock = threading.Lock()
+_session_schema_ready = False
+
+
 def _open_session_db() -> sqlite3.Connection:
+	"""Return this thread's persistent session DB connection.
+
+	Callers keep using `with _open_session_db() as conn:`; sqlite3's context
+	manager commits/rolls back the transaction but does not close the connection.
+	"""
+	global _session_schema_ready
+	conn = getattr(_session_db_local, "conn", None)
+	if conn is not None:
+		return conn
+
 	conn = sqlite3.connect(_SESSION_DB_PATH)
 	conn.row_factory = sqlite3.Row
-	_init_session_schema(conn)
+	conn.execute("PRAGMA journal_mode=WAL")
+	conn.execute("PRAGMA synchronous=NORMAL")
+	conn.execute("PRAGMA temp_store=MEMORY")
+	conn.execute("PRAGMA mmap_size=268435456")
+	if not _session_schema_ready:
+		with _session_schema_lock:
+			if not _session_schema_ready:
+				_init_session_schema(conn)
+				_session_schema_ready = True
+	_session_db_local.conn = conn
 	return conn
 
 
@@ -498,14 +876,15 @@ def get_session_history(session_id: str) -> list[dict[str, Any]]:
 		if row is not None:
 			raw = row["history_json"]
 			try:
-				parsed = json.loads(raw)
+				parsed = _json_loads(raw)
 				return parsed if isinstance(parsed, list) else []
 			except Exception:
 				return []
 
+		# OR IGNORE: a concurrent reader may have created the row in the meantime.
 		conn.execute(
-			"INSERT INTO sessions (session_id, history_json) VALUES (?, ?)",
-			(session_id, json.dumps([])),
+			"INSERT OR IGNORE INTO sessions (session_id, history_json) VALUES (?, ?)",
+			(session_id, _EMPTY_HISTORY_JSON),
 		)
 		conn.commit()
 		return []
@@ -12,12 +12,15 @@ Usage:
     python ferrellgas_scrubber.py <filepath> [--dry-run]
 """
 
+import os
 import re
 import sys
 import argparse
 import json
+import shutil
+import tempfile
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Optional, TextIO, Tuple
 
 
 class FerrellgasScrubber:
@@ -25,29 +28,29 @@ class FerrellgasScrubber:
     
     def __init__(self):
         # Internal domains: matches ferrellgas.com, ferrellgas.net, ferrellgas.local
-        self.domain_pattern = re.compile(
-            r'(?i)[a-z0-9.-]+\.ferrellgas\.(com|net|local)',
-            re.IGNORECASE
-        )
+        domain = r'[a-z0-9.-]+\.ferrellgas\.(?:com|net|local)'
         
         # Subdomain chains: matches *.internal
-        self.internal_pattern = re.compile(
-            r'(?i)\b[a-z0-9]+(-[a-z0-9]+)*\.internal\b',
-            re.IGNORECASE
-        )
+        internal = r'\b[a-z0-9]+(?:-[a-z0-9]+)*\.internal\b'
         
         # Machine IDs: matches FG-SRV-####, SRV-####, WS-#### patterns
-        self.machine_id_pattern = re.compile(
-            r'\b(FG|SRV|WS)-[0-9]{4,}\b',
-            re.IGNORECASE
-        )
+        machine_id = r'\b(?:FG|SRV|WS)-[0-9]{4,}\b'
+        
+        self.domain_pattern = re.compile(domain, re.IGNORECASE)
+        self.internal_pattern = re.compile(internal, re.IGNORECASE)
+        self.machine_id_pattern = re.compile(machine_id, re.IGNORECASE)
         
-        # Combined pattern for finding all matches
         self.all_patterns = [
             (self.domain_pattern, "domain"),
             (self.internal_pattern, "internal"),
             (self.machine_id_pattern, "machine_id"),
         ]
+        
+        # Combined pattern: one linear scan; the named group tells which rule hit.
+        self.combined_pattern = re.compile(
+            f"(?P<domain>{domain})|(?P<internal>{internal})|(?P<machine_id>{machine_id})",
+            re.IGNORECASE
+        )
     
     def scrub_content(self, content: str) -> Tuple[str, List[Tuple[str, str]]]:
         """
@@ -56,17 +59,25 @@ class FerrellgasScrubber:
         Returns:
             Tuple of (scrubbed_content, list of (pattern_type, matched_text))
         """
-        scrubbed = content
         matches_found = []
         
-        for pattern, pattern_type in self.all_patterns:
-            for match in pattern.finditer(content):
-                matched_text = match.group(0)
-                matches_found.append((pattern_type, matched_text))
-                scrubbed = scrubbed.replace(matched_text, "[Phoenix-Redacted]")
+        def redact(match: re.Match) -> str:
+            matches_found.append((match.lastgroup, match.group(0)))
+            return "[Phoenix-Redacted]"
         
+        scrubbed = self.combined_pattern.sub(redact, content)
         return scrubbed, matches_found
     
+    def _scrub_lines(self, lines: Iterable[str], out: Optional[TextIO]) -> List[Tuple[str, str]]:
+        """Scrub `lines` one at a time, writing to `out` when given; returns matches."""
+        matches_found = []
+        for line in lines:
+            scrubbed, matches = self.scrub_content(line)
+            matches_found.extend(matches)
+            if out is not None:
+                out.write(scrubbed)
+        return matches_found
+    
     def scrub_file(self, filepath: Path, dry_run: bool = False, json_output: bool = False) -> List[Tuple[str, str]]:
         """
         Scrub a file, replacing sensitive patterns.
@@ -86,19 +97,16 @@ class FerrellgasScrubber:
                 print(f"Error: File not found: {filepath}", file=sys.stderr)
             return []
         
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            if json_output:
-                print(json.dumps({"error": f"Error reading file: {e}"}), file=sys.stderr)
-            else:
-                print(f"Error reading file {filepath}: {e}", file=sys.stderr)
-            return []
-        
-        scrubbed_content, matches = self.scrub_content(content)
-        
         if json_output:
+            # JSON mode returns the whole clean text, so the file is read in one go.
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except Exception as e:
+                print(json.dumps({"error": f"Error reading file: {e}"}), file=sys.stderr)
+                return []
+            
+            scrubbed_content, matches = self.scrub_content(content)
             # Output JSON format for programmatic use
             result = {
                 "clean_text": scrubbed_content,
@@ -107,6 +115,26 @@ class FerrellgasScrubber:
             print(json.dumps(result))
             return matches
         
+        # Otherwise stream line by line (all patterns are single-line) into a temp
+        # file next to the source, so peak memory stays O(line) for large logs.
+        tmp_path = None
+        try:
+            with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as src:
+                if dry_run:
+                    matches = self._scrub_lines(src, None)
+                else:
+                    with tempfile.NamedTemporaryFile(
+                        'w', encoding='utf-8', dir=filepath.parent, delete=False,
+                        prefix=f".{filepath.name}.", suffix=".scrub"
+                    ) as dst:
+                        tmp_path = dst.name
+                        matches = self._scrub_lines(src, dst)
+        except Exception as e:
+            if tmp_path:
+                os.unlink(tmp_path)
+            print(f"Error reading file {filepath}: {e}", file=sys.stderr)
+            return []
+        
         if matches:
             if dry_run:
                 print(f"\n[DRY RUN] Would redact {len(matches)} pattern(s) in {filepath}:")
@@ -114,15 +142,18 @@ class FerrellgasScrubber:
                     print(f"  - {pattern_type}: {matched_text}")
             else:
                 try:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(scrubbed_content)
+                    shutil.copymode(filepath, tmp_path)
+                    os.replace(tmp_path, filepath)
                     print(f"✓ Scrubbed {len(matches)} pattern(s) in {filepath}")
                     for pattern_type, matched_text in matches:
                         print(f"  - {pattern_type}: {matched_text}")
                 except Exception as e:
+                    os.unlink(tmp_path)
                     print(f"Error writing file {filepath}: {e}", file=sys.stderr)
                     return []
         else:
+            if tmp_path:
+                os.unlink(tmp_path)
             if dry_run:
                 print(f"[DRY RUN] No patterns found in {filepath}")
             else:
@@ -1,9 +1,10 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+import orjson
 import uvicorn
 import os
+import sys
 import time
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 
 app = FastAPI(title="Mock Memory Service")
 SERVICE_NAME = "mock_memory_service"
@@ -11,42 +12,98 @@ VERSION = "1.0.0"
 PORT = int(os.environ.get("MEMORY_MOCK_PORT", 8003))
 
 
+_log_ts_cache: list = [0, ""]
+
+
+def _log_timestamp(epoch: float) -> str:
+    sec = int(epoch)
+    if sec != _log_ts_cache[0]:
+        _log_ts_cache[0] = sec
+        _log_ts_cache[1] = datetime.fromtimestamp(sec, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _log_ts_cache[1]
+
+
+# Log lines are buffered and flushed once LOG_FLUSH_BYTES have accumulated or
+# LOG_FLUSH_INTERVAL_SECONDS have passed since the last flush (checked as lines
+# are written), and again at shutdown.
+LOG_FLUSH_BYTES = 64 * 1024
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+_log_pending = [0, time.monotonic()]  # [unflushed bytes, last flush time]
+
+
+def _flush_logs() -> None:
+    sys.stdout.buffer.flush()
+    _log_pending[0] = 0
+    _log_pending[1] = time.monotonic()
+
+
+def _write_log_line(entry: dict) -> None:
+    line = orjson.dumps(entry) + b"\n"
+    sys.stdout.buffer.write(line)
+    _log_pending[0] += len(line)
+    if (
+        _log_pending[0] >= LOG_FLUSH_BYTES
+        or time.monotonic() - _log_pending[1] >= LOG_FLUSH_INTERVAL_SECONDS
+    ):
+        _flush_logs()
+
+
+@app.on_event("shutdown")
+async def _shutdown():
+    _flush_logs()
+
+
 # Middleware for structured JSON logging
 @app.middleware("http")
 async def log_requests(request, call_next):
     start_time = time.time()
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
     log_entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _log_timestamp(start_time),
+        "ts_ms": int(start_time * 1000),
         "level": "info",
         "service": SERVICE_NAME,
         "method": request.method,
         "path": request.url.path,
         "status": response.status_code,
-        "latency_ms": round(process_time * 1000, 2),
+        "latency_ms": latency_ms,
     }
-    print(json.dumps(log_entry))
+    _write_log_line(log_entry)
     return response
 
 
+_HEALTH_BYTES = orjson.dumps({"service": SERVICE_NAME, "status": "ok", "version": VERSION})
+
+
 @app.get("/health")
-def health_check():
-    return {"service": SERVICE_NAME, "status": "ok", "version": VERSION}
+async def health_check():
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+# The placeholder payload only changes once per second (its id is the epoch
+# second), so the encoded body is reused within that second.
+_latest_cache: list = [0, b""]
 
 
 @app.get("/memory/latest")
-def get_latest_memory():
-    # Placeholder payload
-    return {
-        "source": SERVICE_NAME,
-        "latest": {
-            "id": f"mem-{int(time.time())}",
-            "summary": "hello from mock memory: knowledge chunk 42 retrieved.",
-            "type": "Episodic KB",
-        },
-    }
+async def get_latest_memory():
+    sec = int(time.time())
+    if sec != _latest_cache[0]:
+        _latest_cache[0] = sec
+        _latest_cache[1] = orjson.dumps(
+            {
+                "source": SERVICE_NAME,
+                "latest": {
+                    "id": f"mem-{sec}",
+                    "summary": "hello from mock memory: knowledge chunk 42 retrieved.",
+                    "type": "Episodic KB",
+                },
+            }
+        )
+    return Response(content=_latest_cache[1], media_type="application/json")
 
 
 if __name__ == "__main__":
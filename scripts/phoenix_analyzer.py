@@ -6,9 +6,12 @@ Analyzes governance reports to provide AI-driven strategic recommendations
 explaining the gap between human rationale and machine consensus.
 """
 
+import asyncio
 import json
+import re
 import sys
 import os
+import threading
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -31,6 +34,54 @@ try:
 except ImportError:
     HAS_GEMINI = False
 
+# Optional: orjson parses/serializes large reports straight from/to bytes.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# LLM clients are built once and shared by every entry (and worker thread), so
+# their HTTP connection pools keep TLS sessions alive across calls.
+_llm_clients: Dict[str, object] = {}
+_llm_clients_lock = threading.Lock()
+
+
+def _get_llm_client(provider: str, api_key: str):
+    client = _llm_clients.get(provider)
+    if client is None:
+        with _llm_clients_lock:
+            client = _llm_clients.get(provider)
+            if client is None:
+                if provider == 'openai':
+                    client = openai.OpenAI(api_key=api_key)
+                elif provider == 'anthropic':
+                    client = Anthropic(api_key=api_key)
+                else:
+                    genai.configure(api_key=api_key)
+                    client = genai.GenerativeModel(os.getenv('GEMINI_MODEL', 'gemini-pro'))
+                _llm_clients[provider] = client
+    return client
+
+
+def _partition_conflicts(conflict_profile: List[Dict]):
+    """
+    Split a conflict profile in one pass.
+    
+    Returns (approving_nodes, disapproving_nodes, avg_disapproval_score).
+    """
+    approving_nodes = []
+    disapproving_nodes = []
+    disapproval_sum = 0
+    for c in conflict_profile:
+        if c.get('approved', False):
+            approving_nodes.append(c)
+        else:
+            disapproving_nodes.append(c)
+            disapproval_sum += c.get('compliance_score', 0)
+    avg_disapproval_score = disapproval_sum / len(disapproving_nodes) if disapproving_nodes else 0
+    return approving_nodes, disapproving_nodes, avg_disapproval_score
+
 
 def analyze_with_llm(
     rationale: str,
@@ -44,13 +95,7 @@ def analyze_with_llm(
     Returns a strategic recommendation string.
     """
     # Build context about the conflict
-    disapproving_nodes = [c for c in conflict_profile if not c.get('approved', False)]
-    approving_nodes = [c for c in conflict_profile if c.get('approved', False)]
-    
-    avg_disapproval_score = (
-        sum(c.get('compliance_score', 0) for c in disapproving_nodes) / len(disapproving_nodes)
-        if disapproving_nodes else 0
-    )
+    approving_nodes, disapproving_nodes, avg_disapproval_score = _partition_conflicts(conflict_profile)
     
     # Construct analysis prompt
     prompt = f"""You are a Strategic Governance Analyst for the Phoenix AGI mesh network.
@@ -81,7 +126,7 @@ Format your response as a concise strategic recommendation (2-3 paragraphs max).
     api_key = os.getenv('OPENAI_API_KEY')
     if HAS_OPENAI and api_key:
         try:
-            client = openai.OpenAI(api_key=api_key)
+            client = _get_llm_client('openai', api_key)
             response = client.chat.completions.create(
                 model=os.getenv('OPENAI_MODEL', 'gpt-4'),
                 messages=[
@@ -98,7 +143,7 @@ Format your response as a concise strategic recommendation (2-3 paragraphs max).
     api_key = os.getenv('ANTHROPIC_API_KEY')
     if HAS_ANTHROPIC and api_key:
         try:
-            client = Anthropic(api_key=api_key)
+            client = _get_llm_client('anthropic', api_key)
             response = client.messages.create(
                 model=os.getenv('ANTHROPIC_MODEL', 'claude-3-5-sonnet-20241022'),
                 max_tokens=500,
@@ -113,8 +158,7 @@ Format your response as a concise strategic recommendation (2-3 paragraphs max).
     api_key = os.getenv('GEMINI_API_KEY')
     if HAS_GEMINI and api_key:
         try:
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel(os.getenv('GEMINI_MODEL', 'gemini-pro'))
+            model = _get_llm_client('gemini', api_key)
             response = model.generate_content(prompt)
             return response.text.strip()
         except Exception as e:
@@ -124,6 +168,16 @@ Format your response as a concise strategic recommendation (2-3 paragraphs max).
     return generate_fallback_analysis(rationale, conflict_profile, agent_id)
 
 
+# Rationale keyword classes for the rule-based fallback, matched in one pass.
+# Plain substrings (no word boundaries), so "testing" still counts as "test".
+_RATIONALE_KEYWORDS = re.compile(
+    r"(?P<diagnostic>troubleshoot|diagnostic|debug|test)"
+    r"|(?P<critical>critical|urgent|emergency|production)"
+    r"|(?P<legacy>legacy|compatibility|deprecated)",
+    re.IGNORECASE,
+)
+
+
 def generate_fallback_analysis(
     rationale: str,
     conflict_profile: List[Dict],
@@ -132,36 +186,34 @@ def generate_fallback_analysis(
     """
     Fallback rule-based analysis when LLM is not available.
     """
-    disapproving_nodes = [c for c in conflict_profile if not c.get('approved', False)]
+    _approving_nodes, disapproving_nodes, avg_score = _partition_conflicts(conflict_profile)
     
     if not disapproving_nodes:
         return "Strategic Alignment: No peer conflicts detected. The override was likely preemptive or for operational consistency."
     
     # Analyze rationale keywords
-    rationale_lower = rationale.lower()
+    hits = {m.lastgroup for m in _RATIONALE_KEYWORDS.finditer(rationale)}
     
     recommendations = []
     
-    if any(word in rationale_lower for word in ['troubleshoot', 'diagnostic', 'debug', 'test']):
+    if 'diagnostic' in hits:
         recommendations.append(
             "Strategic Alignment: Human intervention was necessary for operational recovery or diagnostic purposes. "
             "Recommendation: Consider creating a 'Diagnostic Mode' exception in the Privacy Scrubber for temporary test IPs or localhost ranges."
         )
     
-    if any(word in rationale_lower for word in ['critical', 'urgent', 'emergency', 'production']):
+    if 'critical' in hits:
         recommendations.append(
             "Strategic Alignment: Override was justified by operational urgency. "
             "Recommendation: Implement a 'Critical Operations Override' protocol that temporarily relaxes compliance filters with audit logging."
         )
     
-    if any(word in rationale_lower for word in ['legacy', 'compatibility', 'deprecated']):
+    if 'legacy' in hits:
         recommendations.append(
             "Strategic Alignment: Override was needed for backward compatibility. "
             "Recommendation: Create a 'Legacy Agent Registry' that allows specific deprecated agents to bypass certain compliance checks."
         )
     
-    avg_score = sum(c.get('compliance_score', 0) for c in disapproving_nodes) / len(disapproving_nodes)
-    
     if avg_score < 50:
         recommendations.append(
             f"Mesh Consensus: {len(disapproving_nodes)} nodes rejected with average compliance score of {avg_score:.1f}%. "
@@ -179,30 +231,44 @@ def generate_fallback_analysis(
     return " ".join(recommendations)
 
 
+# Upper bound on concurrent LLM round-trips, to stay inside provider rate limits.
+MAX_CONCURRENT_ANALYSES = int(os.getenv('PHOENIX_ANALYZER_CONCURRENCY', '8'))
+
+
+async def analyze_governance_report_async(report_data: Dict) -> Dict[str, str]:
+    """
+    Analyze all entries of a governance report concurrently.
+    
+    Each entry runs `analyze_with_llm` in a worker thread (the provider SDK calls
+    block on network I/O), at most MAX_CONCURRENT_ANALYSES at a time.
+    
+    Returns: Dict mapping entry index to recommendation string
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+    
+    async def _analyze_entry(entry: Dict) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(
+                analyze_with_llm,
+                entry.get('rationale', ''),
+                entry.get('conflict_profile', []),
+                entry.get('agent_id', 'unknown'),
+                entry.get('commit_hash', 'unknown'),
+            )
+    
+    results = await asyncio.gather(
+        *(_analyze_entry(entry) for entry in report_data.get('entries', []))
+    )
+    return {str(idx): recommendation for idx, recommendation in enumerate(results)}
+
+
 def analyze_governance_report(report_data: Dict) -> Dict[str, str]:
     """
     Analyze all entries in a governance report and return strategic recommendations.
     
     Returns: Dict mapping entry index to recommendation string
     """
-    recommendations = {}
-    
-    for idx, entry in enumerate(report_data.get('entries', [])):
-        rationale = entry.get('rationale', '')
-        conflict_profile = entry.get('conflict_profile', [])
-        agent_id = entry.get('agent_id', 'unknown')
-        commit_hash = entry.get('commit_hash', 'unknown')
-        
-        recommendation = analyze_with_llm(
-            rationale,
-            conflict_profile,
-            agent_id,
-            commit_hash
-        )
-        
-        recommendations[str(idx)] = recommendation
-    
-    return recommendations
+    return asyncio.run(analyze_governance_report_async(report_data))
 
 
 def main():
@@ -216,11 +282,18 @@ def main():
     # Read input
     if len(sys.argv) > 1:
         # Read from file
-        with open(sys.argv[1], 'r', encoding='utf-8') as f:
-            report_data = json.load(f)
+        if orjson is not None:
+            with open(sys.argv[1], 'rb') as f:
+                report_data = orjson.loads(f.read())
+        else:
+            with open(sys.argv[1], 'r', encoding='utf-8') as f:
+                report_data = json.load(f)
     else:
         # Read from stdin
-        report_data = json.load(sys.stdin)
+        if orjson is not None:
+            report_data = orjson.loads(sys.stdin.buffer.read())
+        else:
+            report_data = json.load(sys.stdin)
     
     # Analyze report
     recommendations = analyze_governance_report(report_data)
@@ -232,7 +305,11 @@ def main():
         'llm_available': HAS_OPENAI or HAS_ANTHROPIC or HAS_GEMINI
     }
     
-    print(json.dumps(output, indent=2))
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(output, indent=2))
 
 
 if __name__ == '__main__':
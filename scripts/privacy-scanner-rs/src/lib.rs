@@ -0,0 +1,63 @@
+//! Native multi-pattern scanner for `scripts/validate_privacy.py`.
+//!
+//! Each pattern is compiled and scanned on its own, matching one Python `re`
+//! `finditer` pass per pattern, so a match of one pattern never hides an
+//! overlapping match of another. Unicode is disabled so `\d`, `\s` and `\b`
+//! have the ASCII semantics of a Python bytes pattern.
+
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyBufferError, PyValueError};
+use pyo3::prelude::*;
+use regex_automata::meta::Regex;
+use regex_automata::util::syntax;
+
+#[pyclass(frozen)]
+struct Scanner {
+    regexes: Vec<Regex>,
+}
+
+#[pymethods]
+impl Scanner {
+    #[new]
+    fn new(patterns: Vec<String>) -> PyResult<Self> {
+        let regexes = patterns
+            .iter()
+            .map(|pattern| {
+                Regex::builder()
+                    .syntax(syntax::Config::new().unicode(false).utf8(false))
+                    .build(pattern)
+                    .map_err(|e| PyValueError::new_err(e.to_string()))
+            })
+            .collect::<PyResult<_>>()?;
+        Ok(Scanner { regexes })
+    }
+
+    /// Return `(pattern_index, start, end)` for every match of every pattern
+    /// in `data`, grouped by pattern and in order within each. `data` may be
+    /// any contiguous byte buffer (bytes, mmap, ...).
+    fn scan(&self, py: Python<'_>, data: PyBuffer<u8>) -> PyResult<Vec<(usize, usize, usize)>> {
+        if !data.is_c_contiguous() {
+            return Err(PyBufferError::new_err("buffer must be contiguous"));
+        }
+        // SAFETY: the buffer is contiguous, read-only here, and kept alive
+        // (and its export held) by `data` for the duration of the scan.
+        let haystack =
+            unsafe { std::slice::from_raw_parts(data.buf_ptr() as *const u8, data.len_bytes()) };
+        let hits = py.allow_threads(|| {
+            self.regexes
+                .iter()
+                .enumerate()
+                .flat_map(|(index, regex)| {
+                    regex.find_iter(haystack).map(move |m| (index, m.start(), m.end()))
+                })
+                .collect()
+        });
+        Ok(hits)
+    }
+}
+
+#[pymodule]
+fn privacy_scanner_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<Scanner>()?;
+    Ok(())
+}
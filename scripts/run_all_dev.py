@@ -1,28 +1,31 @@
+import asyncio
 import subprocess
 import os
 import signal
 import sys
 import time
 import json
+import re
 import socket
 import argparse
+from pathlib import Path
+from urllib.parse import urlsplit
 
 # --- Configuration ---
 PID_FILE = ".pids.json"
 APP_VERSION = "0.0.1"
 
 
-# Minimal .env parser
+# Minimal .env parser: KEY=value lines; comments and malformed lines are skipped.
+_ENV_LINE = re.compile(r"^(?!#)[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
 def load_env():
-    env = {}
     try:
-        with open(".env") as f:
-            for line in f:
-                if line.strip() and not line.startswith("#"):
-                    key, value = line.strip().split("=", 1)
-                    env[key] = value
+        data = Path(".env").read_text()
     except FileNotFoundError:
-        pass
+        data = ""
+    env = dict(_ENV_LINE.findall(data))
 
     # Apply defaults if not set in .env
     # --- Core (agent-planner stack) ---
@@ -176,8 +179,11 @@ def services_legacy(env: dict) -> list[dict]:
 
 
 def write_pids(pids):
-    with open(PID_FILE, "w") as f:
+    # Write-then-rename so a concurrent reader never sees a half-written file.
+    tmp_path = PID_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
         json.dump(pids, f)
+    os.replace(tmp_path, PID_FILE)
 
 
 def read_pids():
@@ -188,31 +194,79 @@ def read_pids():
         return []
 
 
+_cleanup_done = False
+
+# POSIX: services are process-group leaders and are signalled as a group.
+# Windows has no process groups (or killpg/WNOHANG); os.kill(pid, SIGTERM)
+# there calls TerminateProcess, which stops the process immediately.
+_HAS_PROCESS_GROUPS = hasattr(os, "killpg")
+
+
+def _signal_service(pid, sig):
+    if _HAS_PROCESS_GROUPS:
+        os.killpg(pid, sig)
+    else:
+        os.kill(pid, sig)
+
+
+def _group_alive(pgid):
+    """True while any process in the group still exists (reaping our own zombies)."""
+
+    if not _HAS_PROCESS_GROUPS:
+        # TerminateProcess is synchronous, and os.kill(pid, 0) would send
+        # CTRL_C_EVENT on Windows, so there is nothing to poll.
+        return False
+    try:
+        os.waitpid(pgid, os.WNOHANG)
+    except ChildProcessError:
+        pass  # Not our child (e.g. `--stop` from another shell) or already reaped.
+    try:
+        os.killpg(pgid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
 def cleanup(signum=None, frame=None):
     """Gracefully terminates all running services via PID file."""
 
+    # SIGINT and SIGTERM can both arrive; only the first call tears down.
+    global _cleanup_done
+    if _cleanup_done:
+        return
+    _cleanup_done = True
+
     pids = read_pids()
     if not pids:
         print("No running services found to stop.")
         return
 
     print("\n--- Initiating Cleanup (Stopping Services) ---")
+    # Services run with start_new_session=True, so each PID is also its process
+    # group ID; signalling the group reaches child compilers/servers too.
     for name, pid in reversed(pids):
         try:
-            os.kill(pid, signal.SIGTERM)
-            print(f"[{name}] Sent SIGTERM to PID: {pid}")
+            _signal_service(pid, signal.SIGTERM)
+            print(f"[{name}] Sent SIGTERM to process group: {pid}")
         except ProcessLookupError:
             print(f"[{name}] PID {pid} not found (already terminated).")
         except Exception as e:
             print(f"[{name}] Error terminating PID {pid}: {e}")
 
-    # Wait a moment for processes to stop
-    time.sleep(2)
+    # Wait up to 2s, returning as soon as every group has exited.
+    pending = [pid for _name, pid in pids]
+    deadline = time.monotonic() + 2
+    while pending and time.monotonic() < deadline:
+        pending = [pid for pid in pending if _group_alive(pid)]
+        if pending:
+            time.sleep(0.05)
 
-    # Attempt to kill any stragglers
-    for name, pid in pids:
+    # Attempt to kill any stragglers (only POSIX has SIGKILL; see above)
+    for pid in pending:
         try:
-            os.kill(pid, signal.SIGKILL)
+            _signal_service(pid, signal.SIGKILL)
         except Exception:
             pass  # Ignore if already gone
 
@@ -221,26 +275,49 @@ def cleanup(signum=None, frame=None):
     print("Cleanup complete. All services stopped.")
 
 
-def wait_for_health_check(url, timeout=30, interval=1):
+async def _probe_health(url: str) -> bool:
+    """One GET of a health URL; True when it answers 200 with status "ok"."""
+
+    parts = urlsplit(url)
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, parts.port or 80), timeout=1.0
+    )
+    try:
+        writer.write(f"GET {parts.path or '/'} HTTP/1.0\r\nHost: {parts.netloc}\r\n\r\n".encode())
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout=1.0)
+    finally:
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    status_line = head.split(b"\r\n", 1)[0].split()
+    if len(status_line) < 2 or status_line[1] != b"200":
+        return False
+    return str(json.loads(body).get("status", "")).lower() == "ok"
+
+
+async def wait_for_health_check(url, timeout=30, interval=0.1):
     """Waits for a service's HTTP health check to pass."""
 
-    start_time = time.time()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
     print(f"  Waiting for health check at {url}...")
-    while time.time() - start_time < timeout:
+    while loop.time() < deadline:
         try:
-            with socket.create_connection(
-                ("localhost", int(url.split(":")[-1].split("/")[0])), timeout=1
-            ) as sock:
-                sock.sendall(b"GET /health HTTP/1.0\r\nHost: localhost\r\n\r\n")
-                response = sock.recv(1024).decode()
-                if "200 OK" in response and '"status":"ok"' in response.lower():
-                    return True
+            if await _probe_health(url):
+                return True
         except Exception:
             pass
-        time.sleep(interval)
+        await asyncio.sleep(interval)
     return False
 
 
+async def wait_for_health_checks(urls):
+    """Probe every health URL concurrently; total wait is the slowest service, not the sum."""
+
+    # Plain asyncio sockets keep this launcher stdlib-only.
+    return await asyncio.gather(*(wait_for_health_check(url) for url in urls))
+
+
 def start_services(profile: str):
     running_pids = []
 
@@ -298,10 +375,14 @@ def start_services(profile: str):
     healthy_count = 0
     all_healthy = True
 
-    for name, pid in running_pids:
-        service = next(s for s in services if s["name"] == name)
+    started = [(name, next(s for s in services if s["name"] == name)) for name, _pid in running_pids]
+    probed = [service for _name, service in started if service["health_url"]]
+    results = asyncio.run(wait_for_health_checks([service["health_url"] for service in probed]))
+    health = dict(zip((service["name"] for service in probed), results))
+
+    for name, service in started:
         if service["health_url"]:
-            if wait_for_health_check(service["health_url"]):
+            if health[name]:
                 print(f"[{name}] Healthy.")
                 healthy_count += 1
             else:
@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# The scripts and services are run as plain modules (no packaging), so their
+# directories are put on sys.path for the tests.
+REPO_ROOT = Path(__file__).resolve().parent.parent
+for directory in ("scripts", "backend-python-agent", "backend-python-common", "backend-python-memory"):
+    sys.path.insert(0, str(REPO_ROOT / directory))
@@ -0,0 +1,34 @@
+import asyncio
+import io
+import sys
+
+import pytest
+
+orjson = pytest.importorskip("orjson")
+
+from log_writer import LogWriter  # noqa: E402
+
+
+class _Stdout:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+
+def test_stop_writes_the_batch_in_progress(monkeypatch):
+    stdout = _Stdout()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    # A long flush interval keeps the entries in the writer's open batch.
+    writer = LogWriter(flush_interval_seconds=60)
+
+    async def run():
+        writer.start()
+        for i in range(3):
+            writer.log({"n": i})
+        await asyncio.sleep(0.01)
+        await writer.stop()
+        writer.log({"n": 3})
+
+    asyncio.run(run())
+
+    lines = stdout.buffer.getvalue().splitlines()
+    assert [orjson.loads(line)["n"] for line in lines] == [0, 1, 2, 3]
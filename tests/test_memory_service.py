@@ -0,0 +1,29 @@
+import importlib
+import sys
+
+import pytest
+
+pytest.importorskip("chromadb")
+pytest.importorskip("sentence_transformers")
+
+
+@pytest.fixture
+def memory_service(tmp_path, monkeypatch):
+    # Importing the module seeds ./chroma_data; keep it in a scratch directory.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("EMBEDDING_PROVIDER", "hash")
+    monkeypatch.delenv("CHROMA_HOST", raising=False)
+    sys.modules.pop("memory_service", None)
+    module = importlib.import_module("memory_service")
+    yield module
+    sys.modules.pop("memory_service", None)
+
+
+def test_seeded_startup_does_not_load_the_embedding_model(memory_service, monkeypatch):
+    # The first import seeded the KBs; start over as a restarted process would.
+    monkeypatch.setattr(memory_service, "_embedding_fn", memory_service._LazyEmbedder())
+    memory_service._collection_cache.clear()
+
+    memory_service.seed_rag_collections()
+
+    assert memory_service._embedding_fn._fn is None
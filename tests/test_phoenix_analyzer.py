@@ -0,0 +1,22 @@
+import types
+
+import phoenix_analyzer
+
+
+def test_get_llm_client_builds_client_once(monkeypatch):
+    created = []
+
+    class StubOpenAI:
+        def __init__(self, api_key):
+            self.api_key = api_key
+            created.append(self)
+
+    monkeypatch.setattr(phoenix_analyzer, "openai", types.SimpleNamespace(OpenAI=StubOpenAI), raising=False)
+    monkeypatch.setattr(phoenix_analyzer, "_llm_clients", {})
+
+    first = phoenix_analyzer._get_llm_client("openai", "k")
+    second = phoenix_analyzer._get_llm_client("openai", "k")
+
+    assert first is second
+    assert first.api_key == "k"
+    assert len(created) == 1
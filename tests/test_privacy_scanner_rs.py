@@ -0,0 +1,39 @@
+import pytest
+
+import validate_privacy
+
+privacy_scanner_rs = pytest.importorskip("privacy_scanner_rs")
+
+
+SAMPLES = [
+    b"",
+    b"no findings here\n",
+    b"1.2.3.4567 a1.2.3.4 1.2.3.4.5 10.0.0.1\r\n",
+    b"KEY=abcdefghijklmnopqrstuvwxyz0123\nsecret : AAAAAAAAAAAAAAAAAAAAAAAA\n",
+    b"TOKEN=short\ntoken=ABCDEFGHIJKLMNOPQRSTU\nkey\n= ABCDEFGHIJKLMNOPQRSTUVWXYZ\n",
+    b"/Users/x/y /home/ /root/a.b-c /home/bob\n",
+    b"\xc3\xa910.0.0.1 \xff\xfe9.9.9.9 \xe2\x80\x8a/root/z\n",
+    b"deploy to /home/10.0.0.1 TOKEN=/home/alice/abcdefghijklmnopqrstu\n",
+]
+
+
+def _expected(data):
+    return [
+        (kind, m.start(), m.end())
+        for kind, kind_re in enumerate(validate_privacy.KIND_RES)
+        for m in kind_re.finditer(data)
+    ]
+
+
+@pytest.mark.parametrize("data", SAMPLES)
+def test_native_scanner_matches_kind_res(data):
+    scanner = privacy_scanner_rs.Scanner(list(validate_privacy.KIND_PATTERNS))
+
+    assert [tuple(hit) for hit in scanner.scan(data)] == _expected(data)
+
+
+def test_native_scanner_accepts_buffers():
+    scanner = privacy_scanner_rs.Scanner(list(validate_privacy.KIND_PATTERNS))
+    data = b"ip 192.168.0.1 at /home/alice\n"
+
+    assert [tuple(hit) for hit in scanner.scan(memoryview(data))] == _expected(data)
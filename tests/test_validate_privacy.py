@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import validate_privacy
+
+
+def test_find_target_files_handles_dot_only_names(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / ".md").write_text("x\n")
+    (tmp_path / ".yaml").write_text("x\n")
+    (tmp_path / "readme.md").write_text("x\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "skipped.md").write_text("x\n")
+
+    found = validate_privacy.find_target_files(tmp_path)
+
+    assert sorted(p.relative_to(tmp_path) for p in found) == sorted([
+        Path(".yaml"),
+        Path("docs/.md"),
+        Path("readme.md"),
+    ])
+
+
+def test_ignore_patterns_keep_inline_flags_scoped(tmp_path, monkeypatch):
+    (tmp_path / ".privacyignore").write_text(
+        "# comment\n"
+        "(?i)^/USERS/example$\n"
+        "^127\\.0\\.0\\.1$\n"
+        "^/root/ci$\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    ignore_re = validate_privacy.load_privacy_ignore()
+
+    assert ignore_re.search("/Users/example")
+    assert ignore_re.search("127.0.0.1")
+    # The (?i) flag must not leak into the other alternatives.
+    assert ignore_re.search("/root/ci")
+    assert not ignore_re.search("/ROOT/CI")
+    assert validate_privacy._as_alternative("(?i)(?s)a.b") == "(?is:a.b)"
+    assert validate_privacy._as_alternative("a|b") == "(?:a|b)"
+
+
+def test_overlapping_findings_of_different_kinds_are_reported(tmp_path, monkeypatch):
+    (tmp_path / ".privacyignore").write_text("^/home/\n")
+    monkeypatch.chdir(tmp_path)
+    doc = tmp_path / "doc.md"
+    doc.write_text(
+        "deploy to /home/10.0.0.1\n"
+        "TOKEN=/root/alice/abcdefghijklmnopqrstu\n"
+    )
+
+    found = validate_privacy.describe_violations(
+        doc, validate_privacy.scan_file(doc, validate_privacy.load_privacy_ignore())
+    )
+
+    # The ignored path must not hide the IP inside it, and a secret must not
+    # hide the path it contains.
+    assert [(label, match, line) for label, match, line, _ in found] == [
+        ("IPv4", "10.0.0.1", 1),
+        ("Local Path", "/root/alice", 2),
+        ("Secret", "TOKEN=/root/alice/abcdefghijklmnopqrstu", 2),
+    ]